@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Event record benchmark
+Builds a large scrape batch the way the adapters do and reports build time
+and the memory the batch holds. Compares plain dict events stamped with
+their own datetime.now() (the old make_event) with Event records that share
+one batch timestamp and interned strings.
+
+Usage:
+    python benchmarks/bench_events.py                   # 1M events
+    python benchmarks/bench_events.py --events 100000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# Add the events-aggregator directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dates import parse_date_range
+from platforms import DevpostAdapter
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+def listing(i: int):
+    """(title, dates, organizer) of the i-th synthetic listing"""
+    day = i % 26 + 1
+    return (f"Synthetic Hackathon #{i}",
+            f"{MONTHS[i % 12]} {day}-{day + 2}, 2025",
+            f"Organizer {i % 997}")
+
+def dict_events(count: int):
+    """Events as the old make_event built them"""
+    adapter = DevpostAdapter()
+    events = []
+    for i in range(count):
+        title, dates, organizer = listing(i)
+        span = parse_date_range(dates)
+        events.append({
+            'title': title,
+            'dates': dates,
+            'start_date': span[0].isoformat(),
+            'end_date': span[1].isoformat(),
+            'organizer': organizer,
+            'category': adapter.category,
+            'platform': adapter.platform,
+            'scraped_at': datetime.now().isoformat()
+        })
+    return events
+
+def record_events(count: int):
+    """Events as make_event builds them now, with one timestamp for the batch"""
+    adapter = DevpostAdapter()
+    scraped_at = datetime.now().isoformat()
+    return [adapter.make_event(*listing(i), scraped_at) for i in range(count)]
+
+def run(build, count: int) -> dict:
+    gc.collect()
+    start = time.perf_counter()
+    events = build(count)
+    elapsed = time.perf_counter() - start
+    del events
+
+    # Separate traced run: tracemalloc slows everything down
+    gc.collect()
+    tracemalloc.start()
+    events = build(count)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del events
+    return {
+        'seconds': elapsed,
+        'events_per_sec': count / elapsed,
+        'held_mib': held / 2 ** 20,
+        'bytes_per_event': held / count
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dict events against Event records")
+    parser.add_argument('--events', type=int, default=1000000, help="events per batch (default: 1000000)")
+    args = parser.parse_args()
+
+    print(f"Event record benchmark ({args.events} events)")
+    print(f"  {'events':<32} {'seconds':>8} {'events/s':>10} {'held MiB':>9} {'bytes/event':>12}")
+    for name, build in (('dict, timestamp per event', dict_events), ('Event, batch timestamp', record_events)):
+        result = run(build, args.events)
+        print(f"  {name:<32} {result['seconds']:>8.2f} {result['events_per_sec']:>10.0f} "
+              f"{result['held_mib']:>9.1f} {result['bytes_per_event']:>12.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Export benchmark
+Writes a large synthetic event set through the export pipeline and reports
+throughput and peak memory, per format and for a single pass feeding every
+format at once.
+
+Usage:
+    python benchmarks/bench_export.py                     # 100k events
+    python benchmarks/bench_export.py --events 1000000 --formats json,ndjson
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Add the events-aggregator directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from events import Event
+from exporters import OUTPUT_FILES, ExportPipeline, create_sink
+
+PLATFORMS = ['Devpost', 'MLH', 'Scaler', 'Unacademy', 'Eventbrite', 'Meetup']
+CATEGORIES = ['Hackathon', 'EdTech Workshop', 'Bootcamp', 'Conference']
+
+def synthetic_events(count: int):
+    """Generate events lazily, so the benchmark itself holds none of them"""
+    for i in range(count):
+        yield Event(
+            title=f"Synthetic Event #{i} <{PLATFORMS[i % len(PLATFORMS)]}>",
+            dates=f"Jul {i % 28 + 1}-{i % 28 + 3}, 2025",
+            start_date=None,
+            end_date=None,
+            organizer=f"Organizer {i % 997}",
+            category=CATEGORIES[i % len(CATEGORIES)],
+            platform=PLATFORMS[i % len(PLATFORMS)],
+            scraped_at='2025-07-01T12:00:00'
+        )
+
+def output_size(path: str) -> int:
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+def export(count: int, formats, output_dir: str):
+    sinks = [create_sink(fmt, os.path.join(output_dir, OUTPUT_FILES[fmt]), "Tech Events", "Benchmark")
+             for fmt in formats]
+    ExportPipeline(sinks).run(synthetic_events(count))
+
+def run(count: int, formats, output_dir: str) -> dict:
+    start = time.perf_counter()
+    export(count, formats, output_dir)
+    elapsed = time.perf_counter() - start
+
+    # Separate traced run: tracemalloc slows everything down
+    tracemalloc.start()
+    export(count, formats, output_dir)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    size = sum(output_size(os.path.join(output_dir, OUTPUT_FILES[fmt])) for fmt in formats)
+    return {
+        'formats': '+'.join(formats),
+        'seconds': elapsed,
+        'events_per_sec': count / elapsed,
+        'peak_mib': peak / 2 ** 20,
+        'output_mib': size / 2 ** 20
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the single-pass event exporter")
+    parser.add_argument('--events', type=int, default=100000, help="synthetic events (default: 100000)")
+    parser.add_argument('--formats', default='json,ndjson,markdown,html',
+                        help="comma-separated formats (default: json,ndjson,markdown,html)")
+    args = parser.parse_args()
+    formats = [fmt.strip() for fmt in args.formats.split(',') if fmt.strip()]
+
+    # Keep the per-sink log lines out of the timings
+    logging.disable(logging.INFO)
+
+    print(f"Export benchmark ({args.events} events)")
+    print(f"  {'formats':<32} {'seconds':>8} {'events/s':>10} {'peak MiB':>9} {'output MiB':>11}")
+    with tempfile.TemporaryDirectory() as output_dir:
+        runs = [[fmt] for fmt in formats]
+        if len(formats) > 1:
+            runs.append(formats)
+        for run_formats in runs:
+            result = run(args.events, run_formats, output_dir)
+            print(f"  {result['formats']:<32} {result['seconds']:>8.2f} {result['events_per_sec']:>10.0f} "
+                  f"{result['peak_mib']:>9.1f} {result['output_mib']:>11.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Event date normalization
+
+Platforms describe dates as free text ("Jul 15-17, 2025", "Sep 28 - Oct 2,
+2025", "Dates TBA"). parse_date_range() turns that into a (start, end)
+pair of dates, memoized because the same strings recur across events and
+runs. IntervalIndex answers "which events are active between A and B"
+without scanning every event.
+"""
+
+import re
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from events import Event
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+_ISO_DATE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+_WEEKDAY = re.compile(r'\b(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*\.?,?\s*')
+_RANGE_SEPARATOR = re.compile(r'\s*(?:-|\bto\b|\buntil\b|\bthrough\b)\s*')
+_MONTH = r'(?P<month>[a-z]{3,9})\.?'
+_DAY = r'(?P<day>\d{1,2})(?:st|nd|rd|th)?'
+_YEAR = r'(?P<year>\d{4})'
+# Tried in order on each side of the range
+_PART_PATTERNS = [
+    re.compile(rf'^{_MONTH}\s+{_DAY}(?:,?\s+{_YEAR})?$'),  # Jul 15, 2025
+    re.compile(rf'^{_DAY}\s+{_MONTH},?(?:\s+{_YEAR})?$'),  # 15 July 2025
+    re.compile(rf'^{_MONTH},?\s+{_YEAR}$'),                # August 2025
+    re.compile(rf'^{_DAY}(?:,?\s+{_YEAR})?$'),             # 17, 2025 (after "Jul 15-")
+    re.compile(rf'^{_MONTH}$'),                            # Aug (before "- Sep 2025")
+]
+
+DateRange = Tuple[date, date]
+
+def _parse_part(text: str) -> Optional[Dict[str, int]]:
+    for pattern in _PART_PATTERNS:
+        match = pattern.match(text)
+        if not match:
+            continue
+        part = {key: value for key, value in match.groupdict().items() if value is not None}
+        if 'month' in part:
+            month = MONTHS.get(part['month'][:3])
+            if month is None:
+                return None
+            part['month'] = month
+        return {key: int(value) for key, value in part.items()}
+    return None
+
+def _month_end(year: int, month: int) -> int:
+    following = date(year + month // 12, month % 12 + 1, 1)
+    return (following - timedelta(days=1)).day
+
+@lru_cache(maxsize=4096)
+def _parse(text: str, reference_year: int) -> Optional[DateRange]:
+    text = text.strip().lower().replace('–', '-').replace('—', '-')
+
+    iso = _ISO_DATE.findall(text)
+    if iso:
+        dates = [date(int(y), int(m), int(d)) for y, m, d in iso[:2]]
+        return dates[0], dates[-1]
+
+    text = _WEEKDAY.sub('', text)
+    sides = _RANGE_SEPARATOR.split(text, maxsplit=1)
+    parts = [_parse_part(side.strip()) for side in sides if side.strip()]
+    if not parts or None in parts:
+        return None
+    # Copies: a single date is both the start and the end
+    start, end = dict(parts[0]), dict(parts[-1])
+
+    # "Jul 15-17, 2025": the end inherits the month, the start the year
+    end.setdefault('month', start.get('month'))
+    start.setdefault('month', end.get('month'))
+    if start['month'] is None:
+        return None
+    start.setdefault('year', end.get('year', reference_year))
+    end.setdefault('year', start['year'])
+
+    # "August 2025" covers the whole month
+    start.setdefault('day', 1)
+    end.setdefault('day', _month_end(end['year'], end['month']))
+
+    first = date(start['year'], start['month'], start['day'])
+    last = date(end['year'], end['month'], end['day'])
+    if last < first and 'year' not in parts[0] and len(parts) > 1:
+        # "Dec 30 - Jan 2, 2026" started the year before
+        first = first.replace(year=first.year - 1)
+    return (first, last) if first <= last else None
+
+def parse_date_range(text: Optional[str], reference_year: Optional[int] = None) -> Optional[DateRange]:
+    """(start, end) dates of a free-text date or range, None if it has no date
+
+    Dates without a year are taken to be in reference_year (default: this year).
+    """
+    if not text:
+        return None
+    try:
+        return _parse(text, reference_year or date.today().year)
+    except ValueError:
+        # Day or month out of range ("Feb 30")
+        return None
+
+@lru_cache(maxsize=4096)
+def _iso_span(text: Optional[str], reference_year: int) -> Tuple[Optional[str], Optional[str]]:
+    span = parse_date_range(text, reference_year)
+    if span is None:
+        return None, None
+    return span[0].isoformat(), span[1].isoformat()
+
+def iso_span(text: Optional[str], reference_year: Optional[int] = None) -> Tuple[Optional[str], Optional[str]]:
+    """(start_date, end_date) event fields: ISO dates, or None when unknown
+
+    Dates without a year are taken to be in reference_year (default: this
+    year). Cached per (text, year), so events with the same dates text
+    share the same strings, and a long-running process doesn't keep last
+    year's dates after New Year.
+    """
+    return _iso_span(text, reference_year or date.today().year)
+
+def event_span(event: Event) -> Optional[DateRange]:
+    """(start, end) of an event, from its normalized fields or its dates text"""
+    if event.start_date:
+        return date.fromisoformat(event.start_date), date.fromisoformat(event.end_date)
+    return parse_date_range(event.dates)
+
+class IntervalIndex:
+    """Events sorted by start date, queryable by overlap with a date range
+
+    The sorted list doubles as an implicit balanced tree (each slice's middle
+    element is its root) where every node stores the latest end date in its
+    subtree. A query skips subtrees ending before the range and those
+    starting after it, so it costs O(log n + matches) instead of O(n).
+    Events without a usable date are kept in `undated`.
+    """
+
+    def __init__(self, events: Iterable[Event]):
+        spans = []
+        self.undated: List[Event] = []
+        for event in events:
+            span = event_span(event)
+            if span is None:
+                self.undated.append(event)
+            else:
+                spans.append((span[0], span[1], event))
+        spans.sort(key=lambda item: item[0])
+
+        self.starts = [start for start, _, _ in spans]
+        self.ends = [end for _, end, _ in spans]
+        self.events = [event for _, _, event in spans]
+        self.max_end = list(self.ends)
+        self._build(0, len(spans))
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def _build(self, lo: int, hi: int) -> Optional[date]:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > self.max_end[mid]:
+                self.max_end[mid] = child
+        return self.max_end[mid]
+
+    def _query(self, lo: int, hi: int, first: date, last: date, out: List[Event]):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        if self.max_end[mid] < first:
+            return
+        self._query(lo, mid, first, last, out)
+        if self.starts[mid] > last:
+            return
+        if self.ends[mid] >= first:
+            out.append(self.events[mid])
+        self._query(mid + 1, hi, first, last, out)
+
+    def active_between(self, first: date, last: date) -> List[Event]:
+        """Events overlapping [first, last] (inclusive), ordered by start date"""
+        out: List[Event] = []
+        self._query(0, len(self.events), first, last, out)
+        return out
+
+    def upcoming(self, today: Optional[date] = None) -> List[Event]:
+        """Events that haven't ended yet, ordered by start date"""
+        return self.active_between(today or date.today(), date.max)
@@ -0,0 +1,170 @@
+"""
+Cross-platform event deduplication
+
+The same hackathon is often listed on several platforms. deduplicate()
+finds those listings without comparing every pair of events: events are
+blocked by (month, title token), so only events starting or ending in the
+same month and sharing a reasonably rare title word are compared.
+Candidates from different platforms with overlapping dates and similar
+titles are merged with union-find into one event that lists every source
+platform.
+"""
+
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from dates import event_span
+from events import FIELDS, Event
+
+# Words that appear in too many event titles to identify one
+STOPWORDS = frozenset("""
+    a an and at by for in of on the to with
+    hackathon hack hacks challenge summit conference workshop bootcamp masterclass event
+    edition annual online virtual global
+""".split())
+
+_YEAR = re.compile(r'^(?:19|20)\d{2}$')
+
+def normalize_title(title: str) -> str:
+    """Casefolded title words without punctuation or years (dates are compared separately)"""
+    return ' '.join(word for word in re.findall(r'\w+', title.casefold()) if not _YEAR.match(word))
+
+def title_tokens(normalized: str) -> FrozenSet[str]:
+    words = normalized.split()
+    tokens = frozenset(word for word in words if word not in STOPWORDS)
+    # A title made only of stopwords still needs something to block on
+    return tokens or frozenset(words)
+
+def title_similarity(a: str, b: str, tokens_a: FrozenSet[str], tokens_b: FrozenSet[str]) -> float:
+    """Best of word-set Jaccard (reordered titles) and character ratio (typos, spacing)"""
+    if a == b:
+        return 1.0
+    jaccard = len(tokens_a & tokens_b) / len(tokens_a | tokens_b) if tokens_a or tokens_b else 0.0
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    if jaccard >= matcher.real_quick_ratio():
+        return jaccard
+    return max(jaccard, matcher.ratio())
+
+class _DisjointSet:
+    """Union-find over events that never puts two listings of one platform in a set
+
+    A platform lists an event once, so two of its listings in one group are
+    two different events; they'd only get there through a chain of matches
+    with other platforms (A~X, X~B).
+    """
+
+    def __init__(self, platforms: List[FrozenSet[str]]):
+        self.parent = list(range(len(platforms)))
+        # Platforms of each set's listings, kept on the root
+        self.platforms = list(platforms)
+
+    def find(self, item: int) -> int:
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of a and b, unless they share a platform"""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return True
+        if self.platforms[root_a] & self.platforms[root_b]:
+            return False
+        root, child = min(root_a, root_b), max(root_a, root_b)
+        self.parent[child] = root
+        self.platforms[root] = self.platforms[root] | self.platforms[child]
+        self.platforms[child] = frozenset()
+        return True
+
+def _merge(events: List[Event]) -> Event:
+    """First listing's fields, gaps filled from the others, plus every source platform"""
+    values = {}
+    for field in FIELDS:
+        values[field] = next((getattr(event, field) for event in events if getattr(event, field) is not None),
+                             None)
+    platforms = []
+    for event in events:
+        for platform in event.platforms or [event.platform]:
+            if platform not in platforms:
+                platforms.append(platform)
+    return Event(**values, platforms=platforms)
+
+class EventDeduplicator:
+    """Merges listings of the same event from different platforms
+
+    Every event gets one blocking key per (start or end month, title token).
+    Blocks larger than max_block_size are dropped: their token is too common
+    to be evidence of anything, and the event's rarer tokens still pair it
+    with its duplicates. Within the remaining blocks, pairs from different
+    platforms whose dates overlap and whose titles score at least threshold
+    are merged, unless that would put two listings of the same platform in
+    one group. Undated events only block with other undated events.
+    """
+
+    def __init__(self, threshold: float = 0.8, max_block_size: int = 200):
+        self.threshold = threshold
+        self.max_block_size = max_block_size
+
+    def _blocks(self, titles: List[Tuple[str, FrozenSet[str]]],
+                spans: List[Optional[tuple]]) -> Iterable[List[int]]:
+        blocks: Dict[tuple, List[int]] = defaultdict(list)
+        for index, ((_, tokens), span) in enumerate(zip(titles, spans)):
+            months = {(day.year, day.month) for day in span} if span else {None}
+            for month in months:
+                for token in tokens:
+                    blocks[(month, token)].append(index)
+        return (members for members in blocks.values() if 1 < len(members) <= self.max_block_size)
+
+    def _matches(self, a: int, b: int, events, titles, spans) -> bool:
+        if events[a].platform == events[b].platform:
+            return False
+        span_a, span_b = spans[a], spans[b]
+        if span_a and span_b and (span_a[1] < span_b[0] or span_b[1] < span_a[0]):
+            return False
+        (title_a, tokens_a), (title_b, tokens_b) = titles[a], titles[b]
+        return title_similarity(title_a, title_b, tokens_a, tokens_b) >= self.threshold
+
+    def groups(self, events: List[Event]) -> List[List[int]]:
+        """Indexes of the events in each duplicate group, in input order"""
+        titles = []
+        for event in events:
+            normalized = normalize_title(event.title or '')
+            titles.append((normalized, title_tokens(normalized)))
+        spans = [event_span(event) for event in events]
+
+        disjoint = _DisjointSet([frozenset(event.platforms or [event.platform]) for event in events])
+        compared = set()
+        for members in self._blocks(titles, spans):
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    if (a, b) in compared or disjoint.find(a) == disjoint.find(b):
+                        continue
+                    compared.add((a, b))
+                    if self._matches(a, b, events, titles, spans):
+                        disjoint.union(a, b)
+
+        groups: Dict[int, List[int]] = {}
+        for index in range(len(events)):
+            groups.setdefault(disjoint.find(index), []).append(index)
+        return list(groups.values())
+
+    def deduplicate(self, events: List[Event]) -> List[Event]:
+        """Events with cross-platform duplicates merged, in order of first listing
+
+        Merged events keep the first listing's platform and gain a
+        `platforms` list of every platform that lists them.
+        """
+        deduplicated = []
+        for group in self.groups(events):
+            if len(group) == 1:
+                deduplicated.append(events[group[0]])
+            else:
+                deduplicated.append(_merge([events[index] for index in group]))
+        return deduplicated
+
+def deduplicate(events: List[Event], threshold: float = 0.8) -> List[Event]:
+    """Merge cross-platform duplicates with the default blocking settings"""
+    return EventDeduplicator(threshold).deduplicate(events)
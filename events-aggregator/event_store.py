@@ -0,0 +1,175 @@
+"""
+Persistent SQLite event store
+
+Events are upserted per run, keyed on (platform, normalized title). The
+store remembers when each event was first seen, last seen and last
+changed, keeps every run's counts, and records a fingerprint of the event
+set each output file was generated from, so unchanged outputs can be
+skipped.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from events import Event
+
+# Fields that make up an event's content; scraped_at changes every run
+CONTENT_FIELDS = ('title', 'dates', 'start_date', 'end_date', 'organizer', 'category', 'platform', 'platforms')
+
+class RunChanges:
+    """What a run changed in the store"""
+
+    def __init__(self, run_id: int, inserted: int, updated: int, unchanged: int):
+        self.run_id = run_id
+        self.inserted = inserted
+        self.updated = updated
+        self.unchanged = unchanged
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.inserted or self.updated)
+
+    def __repr__(self):
+        return (f"RunChanges(run_id={self.run_id}, inserted={self.inserted}, "
+                f"updated={self.updated}, unchanged={self.unchanged})")
+
+class EventStore:
+    """SQLite-backed history of scraped events"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TEXT NOT NULL,
+            inserted INTEGER NOT NULL DEFAULT 0,
+            updated INTEGER NOT NULL DEFAULT 0,
+            unchanged INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            platform TEXT NOT NULL,
+            title_key TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            data TEXT NOT NULL,
+            first_seen_run INTEGER NOT NULL,
+            last_seen_run INTEGER NOT NULL,
+            changed_run INTEGER NOT NULL,
+            UNIQUE (platform, title_key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_events_changed ON events (changed_run);
+        CREATE TABLE IF NOT EXISTS outputs (
+            path TEXT PRIMARY KEY,
+            fingerprint TEXT NOT NULL,
+            generated_at TEXT NOT NULL
+        );
+    """
+
+    UPSERT = """
+        INSERT INTO events (platform, title_key, fingerprint, data, first_seen_run, last_seen_run, changed_run)
+        VALUES (:platform, :title_key, :fingerprint, :data, :run, :run, :run)
+        ON CONFLICT (platform, title_key) DO UPDATE SET
+            last_seen_run = excluded.last_seen_run,
+            changed_run = CASE WHEN fingerprint = excluded.fingerprint
+                               THEN changed_run ELSE excluded.changed_run END,
+            fingerprint = excluded.fingerprint,
+            data = excluded.data
+    """
+
+    def __init__(self, path: str = 'data/events.db'):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(self.SCHEMA)
+
+    @staticmethod
+    def title_key(title: str) -> str:
+        """Title with case, punctuation and spacing differences removed"""
+        return ' '.join(re.findall(r'\w+', title.casefold()))
+
+    @staticmethod
+    def fingerprint(event: Event) -> str:
+        """Hash of an event's content fields"""
+        content = json.dumps([getattr(event, field) for field in CONTENT_FIELDS], ensure_ascii=False)
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def set_fingerprint(cls, events: Iterable[Event]) -> str:
+        """Hash of an ordered event list's content, for output staleness checks"""
+        digest = hashlib.sha1()
+        for event in events:
+            digest.update(cls.fingerprint(event).encode('ascii'))
+        return digest.hexdigest()
+
+    def record_run(self, events: Iterable[Event]) -> RunChanges:
+        """Upsert a run's events and return what changed"""
+        with self._conn:
+            run_id = self._conn.execute(
+                'INSERT INTO runs (started_at) VALUES (?)', (datetime.now().isoformat(),)
+            ).lastrowid
+            self._conn.executemany(self.UPSERT, (
+                {
+                    'platform': event.platform,
+                    'title_key': self.title_key(event.title),
+                    'fingerprint': self.fingerprint(event),
+                    'data': json.dumps(event.to_dict(), ensure_ascii=False),
+                    'run': run_id
+                }
+                for event in events
+            ))
+            inserted, updated, seen = self._conn.execute(
+                'SELECT SUM(first_seen_run = :run), SUM(changed_run = :run AND first_seen_run != :run), COUNT(*) '
+                'FROM events WHERE last_seen_run = :run', {'run': run_id}
+            ).fetchone()
+            changes = RunChanges(run_id, inserted or 0, updated or 0, seen - (inserted or 0) - (updated or 0))
+            self._conn.execute(
+                'UPDATE runs SET inserted = ?, updated = ?, unchanged = ? WHERE id = ?',
+                (changes.inserted, changes.updated, changes.unchanged, run_id)
+            )
+        return changes
+
+    def changed_in_run(self, run_id: int) -> List[Event]:
+        """Events inserted or updated by the given run"""
+        rows = self._conn.execute(
+            'SELECT data FROM events WHERE changed_run = ? ORDER BY id', (run_id,)
+        ).fetchall()
+        return [Event.from_dict(json.loads(row['data'])) for row in rows]
+
+    def events(self, platform: Optional[str] = None) -> List[Event]:
+        """Every event ever stored (latest version of each), oldest first"""
+        query = 'SELECT data FROM events'
+        params = []
+        if platform:
+            query += ' WHERE platform = ?'
+            params.append(platform)
+        rows = self._conn.execute(query + ' ORDER BY id', params).fetchall()
+        return [Event.from_dict(json.loads(row['data'])) for row in rows]
+
+    def runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Most recent runs first, with their change counts"""
+        rows = self._conn.execute('SELECT * FROM runs ORDER BY id DESC LIMIT ?', (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def output_is_current(self, path: str, fingerprint: str) -> bool:
+        """Whether path exists and was generated from events with this fingerprint"""
+        row = self._conn.execute('SELECT fingerprint FROM outputs WHERE path = ?', (path,)).fetchone()
+        return row is not None and row['fingerprint'] == fingerprint and os.path.exists(path)
+
+    def mark_output(self, path: str, fingerprint: str):
+        with self._conn:
+            self._conn.execute(
+                'INSERT INTO outputs (path, fingerprint, generated_at) VALUES (?, ?, ?) '
+                'ON CONFLICT (path) DO UPDATE SET fingerprint = excluded.fingerprint, '
+                'generated_at = excluded.generated_at',
+                (path, fingerprint, datetime.now().isoformat())
+            )
+
+    def close(self):
+        self._conn.close()
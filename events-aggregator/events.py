@@ -0,0 +1,84 @@
+"""
+Event record
+
+A scrape can hold hundreds of thousands of events, and most of their
+strings repeat: the platform, the category, the dates and the batch's
+scraped_at timestamp. Events are therefore __slots__ records rather than
+dicts (no per-event hash table), and the repeated strings are shared:
+platform and category are interned, make_event() reuses the batch
+timestamp and cached date strings, and from_dict() interns what JSON
+decoding duplicated.
+"""
+
+import sys
+from typing import Any, Dict, List, Optional
+
+# Field order of exported events
+FIELDS = ('title', 'dates', 'start_date', 'end_date', 'organizer', 'category', 'platform', 'scraped_at')
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if isinstance(value, str) else value
+
+class Event:
+    """One scraped event
+
+    start_date/end_date are ISO dates parsed from `dates` (None when it has
+    no date). `platforms` is only set on events merged from several
+    platforms' listings.
+    """
+
+    __slots__ = FIELDS + ('platforms',)
+
+    def __init__(self, title: str, dates: str, start_date: Optional[str], end_date: Optional[str],
+                 organizer: str, category: str, platform: str, scraped_at: str,
+                 platforms: Optional[List[str]] = None):
+        self.title = title
+        self.dates = dates
+        self.start_date = start_date
+        self.end_date = end_date
+        self.organizer = organizer
+        # Few distinct values across any number of events
+        self.category = sys.intern(category)
+        self.platform = sys.intern(platform)
+        self.scraped_at = scraped_at
+        self.platforms = platforms
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict for JSON, in export field order"""
+        data = {field: getattr(self, field) for field in FIELDS}
+        if self.platforms:
+            data['platforms'] = list(self.platforms)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Event':
+        """Event from to_dict() output, e.g. loaded from JSON
+
+        Decoding gives every event its own copy of each string, so the
+        repeated ones are interned back into shared copies.
+        """
+        return cls(
+            title=data.get('title'),
+            dates=_intern(data.get('dates')),
+            start_date=_intern(data.get('start_date')),
+            end_date=_intern(data.get('end_date')),
+            organizer=_intern(data.get('organizer')),
+            category=data.get('category') or 'Unknown',
+            platform=data.get('platform') or 'Unknown',
+            scraped_at=_intern(data.get('scraped_at')),
+            platforms=data.get('platforms')
+        )
+
+    def replace(self, **changes) -> 'Event':
+        """Copy of the event with some fields changed"""
+        values = {field: getattr(self, field) for field in self.__slots__}
+        values.update(changes)
+        return Event(**values)
+
+    def __eq__(self, other):
+        if not isinstance(other, Event):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self):
+        return f"Event(title={self.title!r}, dates={self.dates!r}, platform={self.platform!r})"
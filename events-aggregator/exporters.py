@@ -0,0 +1,323 @@
+"""
+Single-pass event export
+
+ExportPipeline walks the events once and hands each event to every sink.
+Sinks write incrementally: JSON and NDJSON go straight to their files,
+while Markdown sections and HTML cards are rendered per event into spooled
+temporary files (in memory up to a size, then on disk) and stitched
+together once the totals that precede them are known.
+"""
+
+import json
+import logging
+import textwrap
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from typing import Any, Dict, Iterable, List
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+from markupsafe import Markup
+
+from events import Event
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = Path(__file__).parent / 'templates'
+TEMPLATE_CACHE_DIR = Path(__file__).parent / 'data' / 'jinja_cache'
+
+# Spooled sections stay in memory up to this size, then move to disk
+SPOOL_MAX_SIZE = 1024 * 1024
+COPY_CHUNK_SIZE = 64 * 1024
+
+@lru_cache(maxsize=None)
+def template_environment() -> Environment:
+    """Jinja environment for templates/, created once per process
+
+    Compiled templates are kept in memory and their bytecode is cached in
+    data/jinja_cache/, so later runs skip compiling the template source.
+    """
+    TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        bytecode_cache=FileSystemBytecodeCache(str(TEMPLATE_CACHE_DIR)),
+        autoescape=select_autoescape(['html'])
+    )
+
+class ExportSummary:
+    """Totals gathered during the pass, available to sinks when closing"""
+
+    def __init__(self):
+        self.total = 0
+        self.generated_at = datetime.now()
+        # Insertion-ordered: platforms and categories in order of first appearance
+        self.platforms: Dict[str, int] = {}
+        self.categories: Dict[str, int] = {}
+
+    def add(self, event: Event):
+        self.total += 1
+        self.platforms[event.platform] = self.platforms.get(event.platform, 0) + 1
+        self.categories[event.category] = self.categories.get(event.category, 0) + 1
+
+def _indented_json(event: Dict[str, Any]) -> str:
+    """json.dumps(event, indent=2) nested two levels deep
+
+    indent= makes json fall back to its pure-Python encoder; for the usual
+    flat event the lines are assembled here from compact C-encoded values.
+    """
+    if not event or any(isinstance(value, (dict, list, tuple)) for value in event.values()):
+        return textwrap.indent(json.dumps(event, indent=2, ensure_ascii=False), '    ')
+    dumps = json.dumps
+    fields = ',\n'.join(f"      {dumps(str(key), ensure_ascii=False)}: {dumps(value, ensure_ascii=False)}"
+                        for key, value in event.items())
+    return f"    {{\n{fields}\n    }}"
+
+def _spooled_chunks(spool) -> Iterable[str]:
+    spool.seek(0)
+    return iter(lambda: spool.read(COPY_CHUNK_SIZE), '')
+
+class ExportSink:
+    """Receives every event once, then the summary"""
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+
+    def write(self, event: Event):
+        raise NotImplementedError
+
+    def close(self, summary: ExportSummary):
+        raise NotImplementedError
+
+class JsonSink(ExportSink):
+    """{"events": [...], "total_count", "generated_at", "platforms"} with indent=2"""
+
+    def __init__(self, filepath):
+        super().__init__(filepath)
+        self.file = open(filepath, 'w', encoding='utf-8')
+        self.file.write('{\n  "events": [')
+        self.first = True
+
+    def write(self, event: Event):
+        self.file.write('\n' if self.first else ',\n')
+        self.first = False
+        self.file.write(_indented_json(event.to_dict()))
+
+    def close(self, summary: ExportSummary):
+        self.file.write('\n  ],\n' if not self.first else '],\n')
+        tail = json.dumps({
+            'total_count': summary.total,
+            'generated_at': summary.generated_at.isoformat(),
+            'platforms': list(summary.platforms)
+        }, indent=2, ensure_ascii=False)
+        # Continue the top-level object opened in __init__
+        self.file.write(tail[2:])
+        self.file.close()
+        logger.info(f"Events saved to JSON: {self.filepath}")
+
+class NdjsonSink(ExportSink):
+    """One compact JSON event per line, for line-by-line consumers"""
+
+    def __init__(self, filepath):
+        super().__init__(filepath)
+        self.file = open(filepath, 'w', encoding='utf-8')
+
+    def write(self, event: Event):
+        self.file.write(json.dumps(event.to_dict(), ensure_ascii=False, separators=(',', ':')))
+        self.file.write('\n')
+
+    def close(self, summary: ExportSummary):
+        self.file.close()
+        logger.info(f"Events saved to NDJSON: {self.filepath}")
+
+class MarkdownSink(ExportSink):
+    """Events grouped by platform; each platform's section is spooled until the end"""
+
+    def __init__(self, filepath):
+        super().__init__(filepath)
+        self.sections: Dict[str, SpooledTemporaryFile] = {}
+
+    def write(self, event: Event):
+        platform = event.platform
+        section = self.sections.get(platform)
+        if section is None:
+            section = self.sections[platform] = SpooledTemporaryFile(
+                max_size=SPOOL_MAX_SIZE, mode='w+', encoding='utf-8')
+        # Merged cross-platform duplicates list every platform they're on
+        listed_on = f"- **Listed on:** {', '.join(event.platforms)}\n" if event.platforms else ''
+        section.write(
+            f"**{event.title}**\n"
+            f"- **Dates:** {event.dates}\n"
+            f"- **Organizer:** {event.organizer}\n"
+            f"{listed_on}"
+            f"- **Category:** {event.category}\n\n"
+        )
+
+    def close(self, summary: ExportSummary):
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            f.write(f"""# Events Dashboard
+
+Generated on: {summary.generated_at.strftime('%Y-%m-%d %H:%M:%S')}
+Total Events: {summary.total}
+
+## Events by Platform
+
+""")
+            for platform, section in self.sections.items():
+                f.write(f"### {platform} ({summary.platforms[platform]} events)\n\n")
+                f.writelines(_spooled_chunks(section))
+                section.close()
+        logger.info(f"Events saved to Markdown: {self.filepath}")
+
+class HtmlSink(ExportSink):
+    """Dashboard page: cards are rendered per event, the page around them at the end"""
+
+    def __init__(self, filepath, title: str, subtitle: str):
+        super().__init__(filepath)
+        self.title = title
+        self.subtitle = subtitle
+        self.card = template_environment().get_template('event_card.html').module.card
+        self.cards = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='w+', encoding='utf-8')
+
+    def write(self, event: Event):
+        self.cards.write(self.card(event))
+        self.cards.write('\n')
+
+    def close(self, summary: ExportSummary):
+        template = template_environment().get_template('dashboard.html')
+        # Stream the rendered chunks straight to the file instead of
+        # building the whole page in memory
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            f.writelines(template.generate(
+                cards=(Markup(chunk) for chunk in _spooled_chunks(self.cards)),
+                total_events=summary.total,
+                platforms=list(summary.platforms),
+                categories=list(summary.categories),
+                title=self.title,
+                subtitle=self.subtitle
+            ))
+        self.cards.close()
+        logger.info(f"HTML dashboard generated: {self.filepath}")
+
+class ShardedDashboardSink(ExportSink):
+    """Dashboard for large catalogs: a small index.html plus sharded event data
+
+    Events are partitioned by (platform, category) and written as
+    data/p<partition>-<shard>.js files of shard_size events each. The
+    partition list with counts is inlined into index.html as the manifest,
+    so filtering only recombines partitions and the page loads the shards
+    behind the visible cards. Shards are JavaScript rather than JSON so the
+    dashboard also works when opened from the filesystem.
+    """
+
+    CARD_HEIGHT = 220
+
+    def __init__(self, output_dir, title: str, subtitle: str, shard_size: int = 500):
+        super().__init__(output_dir)
+        self.title = title
+        self.subtitle = subtitle
+        self.shard_size = shard_size
+        self.data_dir = Path(output_dir) / 'data'
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        # Shards left over from a larger previous export would never be read
+        for stale in self.data_dir.glob('p*-*.js'):
+            stale.unlink()
+        # (platform, category) -> partition number, its pending events and shard count
+        self.partitions: Dict[tuple, int] = {}
+        self.buffers: List[List[Dict[str, Any]]] = []
+        self.counts: List[int] = []
+        self.shards: List[int] = []
+
+    def _flush(self, partition: int):
+        shard = self.shards[partition]
+        events = json.dumps(self.buffers[partition], ensure_ascii=False, separators=(',', ':'))
+        with open(self.data_dir / f'p{partition}-{shard}.js', 'w', encoding='utf-8') as f:
+            f.write(f"eventShardLoaded({partition},{shard},{events});\n")
+        self.shards[partition] += 1
+        self.buffers[partition] = []
+
+    def write(self, event: Event):
+        key = (event.platform, event.category)
+        partition = self.partitions.get(key)
+        if partition is None:
+            partition = self.partitions[key] = len(self.buffers)
+            self.buffers.append([])
+            self.counts.append(0)
+            self.shards.append(0)
+        # Platform and category are implied by the partition
+        self.buffers[partition].append(
+            {field: value for field, value in event.to_dict().items() if field not in ('platform', 'category')})
+        self.counts[partition] += 1
+        if len(self.buffers[partition]) >= self.shard_size:
+            self._flush(partition)
+
+    def close(self, summary: ExportSummary):
+        for partition, buffer in enumerate(self.buffers):
+            if buffer:
+                self._flush(partition)
+
+        manifest = {
+            'shard_size': self.shard_size,
+            'total': summary.total,
+            'partitions': [
+                {'platform': platform, 'category': category, 'count': self.counts[partition]}
+                for (platform, category), partition in self.partitions.items()
+            ]
+        }
+        template = template_environment().get_template('dashboard_sharded.html')
+        with open(Path(self.filepath) / 'index.html', 'w', encoding='utf-8') as f:
+            f.writelines(template.generate(
+                manifest=manifest,
+                card_height=self.CARD_HEIGHT,
+                total_events=summary.total,
+                platforms=list(summary.platforms),
+                categories=list(summary.categories),
+                title=self.title,
+                subtitle=self.subtitle
+            ))
+        logger.info(f"Sharded dashboard generated: {self.filepath} "
+                    f"({sum(self.shards)} shards of up to {self.shard_size} events)")
+
+class ExportPipeline:
+    """Fans one pass over the events out to several sinks"""
+
+    def __init__(self, sinks: List[ExportSink]):
+        self.sinks = sinks
+
+    def run(self, events: Iterable[Event]) -> ExportSummary:
+        summary = ExportSummary()
+        writers = [sink.write for sink in self.sinks]
+        for event in events:
+            summary.add(event)
+            for write in writers:
+                write(event)
+        for sink in self.sinks:
+            sink.close(summary)
+        return summary
+
+# Output file of each export format, relative to the output directory
+OUTPUT_FILES = {
+    'json': 'events.json',
+    'ndjson': 'events.ndjson',
+    'markdown': 'events.md',
+    'html': 'index.html',
+    # Directory: index.html plus data/ shards
+    'sharded': 'dashboard'
+}
+
+def create_sink(fmt: str, filepath, title: str = '', subtitle: str = '') -> ExportSink:
+    """Sink writing one of the OUTPUT_FILES formats to filepath
+
+    title and subtitle are only used by the dashboard formats.
+    """
+    if fmt == 'json':
+        return JsonSink(filepath)
+    if fmt == 'ndjson':
+        return NdjsonSink(filepath)
+    if fmt == 'markdown':
+        return MarkdownSink(filepath)
+    if fmt == 'html':
+        return HtmlSink(filepath, title, subtitle)
+    if fmt == 'sharded':
+        return ShardedDashboardSink(filepath, title, subtitle)
+    raise ValueError(f"Unknown export format: {fmt}")
@@ -4,23 +4,33 @@ Events Aggregator - Main Script
 Scrapes events from multiple platforms and generates dashboard
 """
 
+import argparse
 import asyncio
-import json
 import logging
 import os
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import aiohttp
 import requests
-from bs4 import BeautifulSoup
-from jinja2 import Template
-import time
+
+from dates import IntervalIndex
+from dedup import deduplicate
+from event_store import EventStore
+from events import Event
+from exporters import (OUTPUT_FILES, ExportPipeline, ExportSink, ExportSummary, JsonSink, MarkdownSink,
+                       create_sink)
+from platforms import PlatformAdapter, enabled_platforms
+from rate_limit import DomainRateLimiter
+from settings import setting
+from snapshots import FRESH, STALE, SnapshotCache
 
 # Setup logging
 logging.basicConfig(
-    level=logging.INFO,
+    level=getattr(logging, str(setting('LOG_LEVEL')).upper(), logging.INFO),
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler('events_aggregator.log'),
@@ -30,551 +40,371 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class EventsScraper:
-    def __init__(self):
+    USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    
+    def __init__(self, delay: float = None, timeout: float = None,
+                 platforms: Dict[str, Any] = None,
+                 max_events: Optional[int] = None, max_pages: Optional[int] = None,
+                 refresh: bool = False):
+        """Settings default to config.py: SCRAPING_DELAY, TIMEOUT, PLATFORMS,
+        MAX_EVENTS_PER_PLATFORM and MAX_PAGES_PER_PLATFORM. A limit of None
+        in config means no limit. refresh=True scrapes platforms even when
+        their snapshot is fresh."""
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': self.USER_AGENT
         })
         self.events = []
-        
-    def scrape_devpost(self) -> List[Dict[str, Any]]:
-        """Scrape events from Devpost"""
-        logger.info("Scraping Devpost...")
-        events = []
-        
-        try:
-            url = "https://devpost.com/hackathons"
-            response = self.session.get(url, timeout=10)
+        self.timeout = timeout if timeout is not None else setting('TIMEOUT')
+        self.max_events = max_events if max_events is not None else setting('MAX_EVENTS_PER_PLATFORM')
+        self.max_pages = max_pages if max_pages is not None else setting('MAX_PAGES_PER_PLATFORM')
+        self.platforms = enabled_platforms(platforms if platforms is not None else setting('PLATFORMS'))
+        # Be respectful: at most one request every `delay` seconds per site,
+        # while different sites are fetched in parallel
+        self.rate_limiter = DomainRateLimiter(delay if delay is not None else setting('SCRAPING_DELAY'))
+        # Last successful scrape per platform, served when fresh or when scraping fails
+        self.snapshots = None
+        if setting('SNAPSHOT_DIR'):
+            self.snapshots = SnapshotCache(setting('SNAPSHOT_DIR'), setting('SNAPSHOT_TTL'),
+                                           setting('SNAPSHOT_MAX_STALE'))
+        self.refresh = refresh
+        # Platforms whose events in the last scrape were fetched live, not served from a snapshot
+        self.live_platforms = set()
+        self._refresh_pool: Optional[ThreadPoolExecutor] = None
+        self._refreshes: Dict[str, Future] = {}
+    
+    def _fetch(self, url: str) -> bytes:
+        """GET a page, waiting for the site's rate limit first"""
+        self.rate_limiter.acquire(url)
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.content
+    
+    async def _fetch_async(self, session: aiohttp.ClientSession, url: str) -> bytes:
+        """Async GET of a page, waiting for the site's rate limit first"""
+        await self.rate_limiter.acquire_async(url)
+        async with session.get(url) as response:
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            hackathon_items = soup.find_all('div', class_='hackathon-tile')
-            
-            for item in hackathon_items[:10]:  # Limit to 10 events
-                try:
-                    title_elem = item.find('h3') or item.find('h2') or item.find('a')
-                    title = title_elem.get_text(strip=True) if title_elem else "N/A"
-                    
-                    # Extract dates
-                    date_elem = item.find('div', class_='date-range') or item.find('time')
-                    dates = date_elem.get_text(strip=True) if date_elem else "Dates TBA"
-                    
-                    # Extract organizer
-                    org_elem = item.find('div', class_='organizer') or item.find('.sponsor-name')
-                    organizer = org_elem.get_text(strip=True) if org_elem else "Devpost Community"
-                    
-                    events.append({
-                        'title': title,
-                        'dates': dates,
-                        'organizer': organizer,
-                        'category': 'Hackathon',
-                        'platform': 'Devpost',
-                        'scraped_at': datetime.now().isoformat()
-                    })
-                except Exception as e:
-                    logger.warning(f"Error parsing Devpost item: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error scraping Devpost: {e}")
-            # Add mock data as fallback
-            events.extend(self._get_devpost_fallback())
-            
-        return events
+            return await response.read()
     
-    def scrape_mlh(self) -> List[Dict[str, Any]]:
-        """Scrape events from MLH.io"""
-        logger.info("Scraping MLH...")
-        events = []
+    def _limit_reached(self, count: int) -> bool:
+        return self.max_events is not None and count >= self.max_events
+    
+    def _cached(self, adapter: PlatformAdapter) -> Optional[List[Event]]:
+        """Snapshot events to serve instead of scraping, or None to scrape now
         
+        A stale snapshot is served while a background refresh replaces it.
+        """
+        if self.snapshots is None or self.refresh:
+            return None
+        snapshot = self.snapshots.get(adapter.key)
+        if snapshot is None:
+            return None
+        state = snapshot.state
+        if state == FRESH:
+            logger.info(f"{adapter.platform}: using snapshot from {snapshot.age / 60:.0f} min ago")
+            return snapshot.events
+        if state == STALE:
+            logger.info(f"{adapter.platform}: using snapshot from {snapshot.age / 60:.0f} min ago, "
+                        f"refreshing in the background")
+            self._start_refresh(adapter)
+            return snapshot.events
+        return None
+    
+    def _fallback(self, adapter: PlatformAdapter) -> List[Event]:
+        """Last known good events of a platform that couldn't be scraped"""
+        snapshot = self.snapshots.get(adapter.key) if self.snapshots is not None else None
+        if snapshot is None:
+            logger.warning(f"No snapshot of {adapter.platform} to fall back on")
+            return []
+        logger.warning(f"{adapter.platform}: falling back on snapshot from {snapshot.age / 3600:.1f} h ago")
+        return snapshot.events
+    
+    def _save_snapshot(self, adapter: PlatformAdapter, events: List[Event]):
+        if self.snapshots is not None and events:
+            self.snapshots.put(adapter.key, events)
+    
+    def _start_refresh(self, adapter: PlatformAdapter):
+        if adapter.key in self._refreshes:
+            return
+        if self._refresh_pool is None:
+            self._refresh_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='snapshot-refresh')
+        self._refreshes[adapter.key] = self._refresh_pool.submit(self._refresh_snapshot, adapter)
+    
+    def _refresh_snapshot(self, adapter: PlatformAdapter) -> List[Event]:
+        """Scrape a platform in a background thread and save the result as its snapshot"""
         try:
-            # MLH API endpoint (if available) or website scraping
-            url = "https://mlh.io/seasons/2025/events"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            event_items = soup.find_all('div', class_='event') or soup.find_all('div', class_='hackathon')
-            
-            for item in event_items[:8]:  # Limit to 8 events
-                try:
-                    title_elem = item.find('h3') or item.find('h2') or item.find('a')
-                    title = title_elem.get_text(strip=True) if title_elem else "N/A"
-                    
-                    date_elem = item.find('div', class_='date') or item.find('time')
-                    dates = date_elem.get_text(strip=True) if date_elem else "Dates TBA"
-                    
-                    org_elem = item.find('div', class_='location') or item.find('.university')
-                    organizer = org_elem.get_text(strip=True) if org_elem else "MLH Community"
-                    
-                    events.append({
-                        'title': title,
-                        'dates': dates,
-                        'organizer': organizer,
-                        'category': 'Hackathon',
-                        'platform': 'MLH',
-                        'scraped_at': datetime.now().isoformat()
-                    })
-                except Exception as e:
-                    logger.warning(f"Error parsing MLH item: {e}")
-                    continue
-                    
+            events = list(islice(adapter.iter_events(self._fetch, self.max_pages), self.max_events))
         except Exception as e:
-            logger.error(f"Error scraping MLH: {e}")
-            events.extend(self._get_mlh_fallback())
-            
+            logger.error(f"Background refresh of {adapter.platform} failed: {e}")
+            return []
+        self._save_snapshot(adapter, events)
+        logger.info(f"Refreshed {adapter.platform} snapshot ({len(events)} events)")
         return events
     
-    def scrape_edtech_platforms(self) -> List[Dict[str, Any]]:
-        """Scrape events from EdTech platforms"""
-        logger.info("Scraping EdTech platforms...")
-        events = []
+    def wait_for_refreshes(self) -> List[Event]:
+        """Block until background snapshot refreshes have finished
         
-        # Scaler events
-        try:
-            events.extend(self._scrape_scaler())
-        except Exception as e:
-            logger.error(f"Error scraping Scaler: {e}")
-            events.extend(self._get_scaler_fallback())
+        Returns the events the refreshes scraped.
+        """
+        refreshed = []
+        for refresh in self._refreshes.values():
+            refreshed.extend(refresh.result())
+        self._refreshes.clear()
+        return refreshed
+    
+    def iter_platform_events(self, adapter: PlatformAdapter,
+                             scraped_at: Optional[str] = None) -> Iterator[Event]:
+        """Stream one platform's events, fetching listing pages only as needed
         
-        # Add more EdTech platforms here
-        events.extend(self._get_unacademy_fallback())
+        scraped_at is the batch timestamp given to every event (default: now).
+        """
+        logger.info(f"Scraping {adapter.platform}...")
+        if not adapter.scrapable:
+            logger.warning(f"{adapter.platform} has no listing URL, skipping")
+            return
+        cached = self._cached(adapter)
+        if cached is not None:
+            yield from cached
+            return
         
-        return events
-    
-    def _scrape_scaler(self) -> List[Dict[str, Any]]:
-        """Scrape Scaler events"""
         events = []
         try:
-            url = "https://www.scaler.com/events/"
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            event_cards = soup.find_all('div', class_='event-card') or soup.find_all('div', class_='card')
-            
-            for card in event_cards[:5]:
-                try:
-                    title_elem = card.find('h3') or card.find('h2')
-                    title = title_elem.get_text(strip=True) if title_elem else "Scaler Event"
-                    
-                    date_elem = card.find('div', class_='date') or card.find('time')
-                    dates = date_elem.get_text(strip=True) if date_elem else "Upcoming"
-                    
-                    events.append({
-                        'title': title,
-                        'dates': dates,
-                        'organizer': 'Scaler',
-                        'category': 'EdTech Workshop',
-                        'platform': 'Scaler',
-                        'scraped_at': datetime.now().isoformat()
-                    })
-                except Exception as e:
-                    logger.warning(f"Error parsing Scaler event: {e}")
-                    continue
+            for event in adapter.iter_events(self._fetch, self.max_pages, scraped_at):
+                self.live_platforms.add(adapter.platform)
+                yield event
+                events.append(event)
+                if self._limit_reached(len(events)):
+                    break
         except Exception as e:
-            logger.error(f"Error accessing Scaler: {e}")
-            
-        return events
-    
-    def _get_devpost_fallback(self) -> List[Dict[str, Any]]:
-        """Fallback data for Devpost"""
-        return [
-            {
-                'title': 'Global AI Hackathon 2025',
-                'dates': 'Jul 15-17, 2025',
-                'organizer': 'Devpost Community',
-                'category': 'Hackathon',
-                'platform': 'Devpost',
-                'scraped_at': datetime.now().isoformat()
-            },
-            {
-                'title': 'Web3 Innovation Challenge',
-                'dates': 'Aug 1-3, 2025',
-                'organizer': 'Blockchain Alliance',
-                'category': 'Hackathon',
-                'platform': 'Devpost',
-                'scraped_at': datetime.now().isoformat()
-            }
-        ]
+            logger.error(f"Error scraping {adapter.platform}: {e}")
+            if not events:
+                yield from self._fallback(adapter)
+            return
+        self._save_snapshot(adapter, events)
     
-    def _get_mlh_fallback(self) -> List[Dict[str, Any]]:
-        """Fallback data for MLH"""
-        return [
-            {
-                'title': 'HackMIT 2025',
-                'dates': 'Sep 20-22, 2025',
-                'organizer': 'MIT',
-                'category': 'Hackathon',
-                'platform': 'MLH',
-                'scraped_at': datetime.now().isoformat()
-            },
-            {
-                'title': 'PennApps XXV',
-                'dates': 'Oct 4-6, 2025',
-                'organizer': 'University of Pennsylvania',
-                'category': 'Hackathon',
-                'platform': 'MLH',
-                'scraped_at': datetime.now().isoformat()
-            }
-        ]
+    def iter_events(self) -> Iterator[Event]:
+        """Stream events from every enabled platform, one platform after another"""
+        # One timestamp for the whole batch instead of one per event
+        scraped_at = datetime.now().isoformat()
+        self.live_platforms.clear()
+        for adapter in self.platforms:
+            yield from self.iter_platform_events(adapter, scraped_at)
     
-    def _get_scaler_fallback(self) -> List[Dict[str, Any]]:
-        """Fallback data for Scaler"""
-        return [
-            {
-                'title': 'System Design Masterclass',
-                'dates': 'Jul 25, 2025',
-                'organizer': 'Scaler',
-                'category': 'EdTech Workshop',
-                'platform': 'Scaler',
-                'scraped_at': datetime.now().isoformat()
-            }
-        ]
+    def scrape_platform(self, key: str) -> List[Event]:
+        """Scrape a single platform by its config key (e.g. 'devpost')"""
+        for adapter in self.platforms:
+            if adapter.key == key:
+                return list(self.iter_platform_events(adapter))
+        raise ValueError(f"Platform not enabled: {key}")
     
-    def _get_unacademy_fallback(self) -> List[Dict[str, Any]]:
-        """Fallback data for Unacademy"""
-        return [
-            {
-                'title': 'Data Science Bootcamp',
-                'dates': 'Aug 10-12, 2025',
-                'organizer': 'Unacademy',
-                'category': 'Bootcamp',
-                'platform': 'Unacademy',
-                'scraped_at': datetime.now().isoformat()
-            }
-        ]
-    
-    def scrape_all_platforms(self) -> List[Dict[str, Any]]:
-        """Scrape all platforms and return combined events"""
+    def scrape_all_platforms(self) -> List[Event]:
+        """Scrape all platforms one after another and return combined events"""
         logger.info("Starting to scrape all platforms...")
         
-        all_events = []
+        # Each site is rate limited on its own, so no fixed sleeps in between
+        all_events = list(self.iter_events())
+        
+        logger.info(f"Total events scraped: {len(all_events)}")
+        return all_events
+    
+    async def _scrape_async(self, session: aiohttp.ClientSession, adapter: PlatformAdapter,
+                            scraped_at: Optional[str] = None) -> List[Event]:
+        logger.info(f"Scraping {adapter.platform}...")
+        if not adapter.scrapable:
+            logger.warning(f"{adapter.platform} has no listing URL, skipping")
+            return []
+        cached = self._cached(adapter)
+        if cached is not None:
+            return cached
         
-        # Scrape each platform with delay to be respectful
-        all_events.extend(self.scrape_devpost())
-        time.sleep(2)
+        events = []
+        pages = adapter.aiter_events(lambda url: self._fetch_async(session, url), self.max_pages, scraped_at)
+        try:
+            async for event in pages:
+                self.live_platforms.add(adapter.platform)
+                events.append(event)
+                if self._limit_reached(len(events)):
+                    break
+        except Exception as e:
+            logger.error(f"Error scraping {adapter.platform}: {e}")
+            if not events:
+                return self._fallback(adapter)
+            return events
+        finally:
+            await pages.aclose()
+        self._save_snapshot(adapter, events)
+        return events
+    
+    async def scrape_all_platforms_async(self) -> List[Event]:
+        """Scrape all platforms concurrently and return combined events"""
+        logger.info("Starting to scrape all platforms concurrently...")
         
-        all_events.extend(self.scrape_mlh())
-        time.sleep(2)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        scraped_at = datetime.now().isoformat()
+        self.live_platforms.clear()
+        async with aiohttp.ClientSession(headers={'User-Agent': self.USER_AGENT}, timeout=timeout) as session:
+            results = await asyncio.gather(*(self._scrape_async(session, adapter, scraped_at)
+                                             for adapter in self.platforms))
         
-        all_events.extend(self.scrape_edtech_platforms())
+        # Results keep the platform order of the sync path
+        all_events = [event for events in results for event in events]
         
         logger.info(f"Total events scraped: {len(all_events)}")
         return all_events
 
 class DashboardGenerator:
-    def __init__(self, events: List[Dict[str, Any]]):
+    # Output file per export format
+    OUTPUT_FILES = OUTPUT_FILES
+    DEFAULT_FORMATS = ('json', 'markdown', 'html')
+    
+    def __init__(self, events: Iterable[Event]):
         self.events = events
+    
+    def _sink(self, fmt: str, filepath) -> ExportSink:
+        return create_sink(fmt, filepath, setting('DASHBOARD_TITLE'), setting('DASHBOARD_SUBTITLE'))
+    
+    def export(self, output_dir, formats: Iterable[str] = DEFAULT_FORMATS) -> ExportSummary:
+        """Write every requested format in a single pass over the events"""
+        sinks = [self._sink(fmt, os.path.join(output_dir, self.OUTPUT_FILES.get(fmt, ''))) for fmt in formats]
+        return ExportPipeline(sinks).run(self.events)
         
     def save_to_json(self, filepath: str):
         """Save events to JSON file"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump({
-                'events': self.events,
-                'total_count': len(self.events),
-                'generated_at': datetime.now().isoformat(),
-                'platforms': list(set([event.get('platform', 'Unknown') for event in self.events]))
-            }, f, indent=2, ensure_ascii=False)
-        logger.info(f"Events saved to JSON: {filepath}")
+        ExportPipeline([JsonSink(filepath)]).run(self.events)
     
     def save_to_markdown(self, filepath: str):
         """Save events to Markdown file"""
-        md_content = f"""# Events Dashboard
+        ExportPipeline([MarkdownSink(filepath)]).run(self.events)
+    
+    def generate_html_dashboard(self, output_dir: str):
+        """Generate HTML dashboard"""
+        ExportPipeline([self._sink('html', os.path.join(output_dir, 'index.html'))]).run(self.events)
 
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Total Events: {len(self.events)}
+def export_formats(value: str) -> List[str]:
+    """argparse type for --formats: comma-separated names from OUTPUT_FILES"""
+    formats = [fmt.strip() for fmt in value.split(',') if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in DashboardGenerator.OUTPUT_FILES]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown format(s) {', '.join(unknown)} (choose from {', '.join(DashboardGenerator.OUTPUT_FILES)})")
+    if not formats:
+        raise argparse.ArgumentTypeError("no format given")
+    return formats
 
-## Events by Platform
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape tech events and generate a dashboard")
+    parser.add_argument('--sync', action='store_true',
+                        help="scrape platforms one after another instead of concurrently")
+    parser.add_argument('--formats', type=export_formats,
+                        default=list(DashboardGenerator.DEFAULT_FORMATS),
+                        help="comma-separated outputs: json, ndjson, markdown, html, sharded "
+                             "(default: json,markdown,html)")
+    parser.add_argument('--upcoming', action='store_true', help="only keep events that haven't ended")
+    parser.add_argument('--from', dest='date_from', type=date.fromisoformat, metavar='YYYY-MM-DD',
+                        help="only keep events active on or after this date")
+    parser.add_argument('--until', dest='date_until', type=date.fromisoformat, metavar='YYYY-MM-DD',
+                        help="only keep events active on or before this date")
+    parser.add_argument('--refresh', action='store_true',
+                        help="scrape every platform, even those with a fresh snapshot")
+    parser.add_argument('--force', action='store_true',
+                        help="regenerate every output, even those whose events haven't changed")
+    return parser.parse_args(argv)
 
-"""
-        
-        # Group events by platform
-        platforms = {}
-        for event in self.events:
-            platform = event.get('platform', 'Unknown')
-            if platform not in platforms:
-                platforms[platform] = []
-            platforms[platform].append(event)
-        
-        for platform, events in platforms.items():
-            md_content += f"### {platform} ({len(events)} events)\n\n"
-            for event in events:
-                md_content += f"**{event['title']}**\n"
-                md_content += f"- **Dates:** {event['dates']}\n"
-                md_content += f"- **Organizer:** {event['organizer']}\n"
-                md_content += f"- **Category:** {event['category']}\n\n"
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(md_content)
-        logger.info(f"Events saved to Markdown: {filepath}")
+def filter_by_date(events: List[Event], first: date, last: date) -> List[Event]:
+    """Events active between first and last, by start date; undated events are kept at the end"""
+    index = IntervalIndex(events)
+    return index.active_between(first, last) + index.undated
+
+def export_events(args, events: List[Event], store: Optional[EventStore], output_dir) -> bool:
+    """Deduplicate, filter and export a run's events; False if none are left
     
-    def generate_html_dashboard(self, output_dir: str):
-        """Generate HTML dashboard"""
-        html_template = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Events Dashboard</title>
-    <style>
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        body { 
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            padding: 20px;
-        }
-        .container { 
-            max-width: 1200px; 
-            margin: 0 auto; 
-            background: rgba(255,255,255,0.95);
-            border-radius: 20px;
-            padding: 30px;
-            box-shadow: 0 20px 40px rgba(0,0,0,0.1);
-        }
-        .header { 
-            text-align: center; 
-            margin-bottom: 40px;
-            border-bottom: 3px solid #667eea;
-            padding-bottom: 20px;
-        }
-        .header h1 { 
-            color: #333; 
-            font-size: 2.5em; 
-            margin-bottom: 10px;
-        }
-        .stats { 
-            display: flex; 
-            justify-content: center; 
-            gap: 30px; 
-            margin: 20px 0;
-            flex-wrap: wrap;
-        }
-        .stat-card { 
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            color: white; 
-            padding: 15px 25px; 
-            border-radius: 15px;
-            text-align: center;
-            box-shadow: 0 5px 15px rgba(0,0,0,0.2);
-        }
-        .stat-number { font-size: 2em; font-weight: bold; }
-        .stat-label { font-size: 0.9em; opacity: 0.9; }
-        .filters { 
-            margin: 30px 0; 
-            text-align: center;
-        }
-        .filter-btn { 
-            background: #fff; 
-            border: 2px solid #667eea; 
-            color: #667eea; 
-            padding: 8px 16px; 
-            margin: 5px; 
-            border-radius: 25px; 
-            cursor: pointer;
-            transition: all 0.3s ease;
-        }
-        .filter-btn:hover, .filter-btn.active { 
-            background: #667eea; 
-            color: white;
-            transform: translateY(-2px);
-        }
-        .events-grid { 
-            display: grid; 
-            grid-template-columns: repeat(auto-fill, minmax(350px, 1fr)); 
-            gap: 25px; 
-            margin-top: 30px;
-        }
-        .event-card { 
-            background: white; 
-            border-radius: 15px; 
-            padding: 25px; 
-            box-shadow: 0 10px 25px rgba(0,0,0,0.1);
-            transition: all 0.3s ease;
-            border-left: 5px solid #667eea;
-        }
-        .event-card:hover { 
-            transform: translateY(-5px); 
-            box-shadow: 0 15px 35px rgba(0,0,0,0.15);
-        }
-        .event-title { 
-            font-size: 1.3em; 
-            font-weight: bold; 
-            color: #333; 
-            margin-bottom: 15px;
-            line-height: 1.4;
-        }
-        .event-detail { 
-            margin: 10px 0; 
-            display: flex; 
-            align-items: center;
-        }
-        .event-detail strong { 
-            color: #667eea; 
-            min-width: 80px;
-            margin-right: 10px;
-        }
-        .category-badge { 
-            display: inline-block; 
-            background: linear-gradient(45deg, #667eea, #764ba2);
-            color: white; 
-            padding: 5px 12px; 
-            border-radius: 20px; 
-            font-size: 0.8em; 
-            font-weight: bold;
-            margin-top: 10px;
-        }
-        .platform-tag { 
-            position: absolute; 
-            top: 15px; 
-            right: 15px; 
-            background: rgba(102, 126, 234, 0.1); 
-            color: #667eea; 
-            padding: 5px 10px; 
-            border-radius: 10px; 
-            font-size: 0.8em;
-        }
-        .event-card { position: relative; }
-        @media (max-width: 768px) {
-            .events-grid { grid-template-columns: 1fr; }
-            .stats { flex-direction: column; align-items: center; }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🚀 Events Dashboard</h1>
-            <p>Discover the latest hackathons, bootcamps, and tech events</p>
-            <div class="stats">
-                <div class="stat-card">
-                    <div class="stat-number">{{ total_events }}</div>
-                    <div class="stat-label">Total Events</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{{ platforms|length }}</div>
-                    <div class="stat-label">Platforms</div>
-                </div>
-                <div class="stat-card">
-                    <div class="stat-number">{{ categories|length }}</div>
-                    <div class="stat-label">Categories</div>
-                </div>
-            </div>
-        </div>
-        
-        <div class="filters">
-            <button class="filter-btn active" onclick="filterEvents('all')">All Events</button>
-            {% for platform in platforms %}
-            <button class="filter-btn" onclick="filterEvents('{{ platform }}')">{{ platform }}</button>
-            {% endfor %}
-        </div>
-        
-        <div class="events-grid" id="events-grid">
-            {% for event in events %}
-            <div class="event-card" data-platform="{{ event.platform }}">
-                <div class="platform-tag">{{ event.platform }}</div>
-                <div class="event-title">{{ event.title }}</div>
-                <div class="event-detail">
-                    <strong>📅 Dates:</strong>
-                    <span>{{ event.dates }}</span>
-                </div>
-                <div class="event-detail">
-                    <strong>👥 Organizer:</strong>
-                    <span>{{ event.organizer }}</span>
-                </div>
-                <span class="category-badge">{{ event.category }}</span>
-            </div>
-            {% endfor %}
-        </div>
-    </div>
+    With a store, outputs already generated from the same events are skipped
+    (unless --force).
+    """
+    if setting('DEDUPLICATE'):
+        scraped = len(events)
+        events = deduplicate(events)
+        logger.info(f"Merged {scraped - len(events)} cross-platform duplicates")
     
-    <script>
-        function filterEvents(platform) {
-            const cards = document.querySelectorAll('.event-card');
-            const buttons = document.querySelectorAll('.filter-btn');
-            
-            // Update button states
-            buttons.forEach(btn => btn.classList.remove('active'));
-            event.target.classList.add('active');
-            
-            // Filter cards
-            cards.forEach(card => {
-                if (platform === 'all' || card.dataset.platform === platform) {
-                    card.style.display = 'block';
-                } else {
-                    card.style.display = 'none';
-                }
-            });
-        }
-        
-        // Add some animation on load
-        document.addEventListener('DOMContentLoaded', function() {
-            const cards = document.querySelectorAll('.event-card');
-            cards.forEach((card, index) => {
-                card.style.opacity = '0';
-                card.style.transform = 'translateY(20px)';
-                setTimeout(() => {
-                    card.style.transition = 'all 0.5s ease';
-                    card.style.opacity = '1';
-                    card.style.transform = 'translateY(0)';
-                }, index * 100);
-            });
-        });
-    </script>
-</body>
-</html>
-        """
-        
-        # Prepare template data
-        platforms = list(set([event.get('platform', 'Unknown') for event in self.events]))
-        categories = list(set([event.get('category', 'Unknown') for event in self.events]))
-        
-        template = Template(html_template)
-        html_content = template.render(
-            events=self.events,
-            total_events=len(self.events),
-            platforms=platforms,
-            categories=categories
-        )
-        
-        # Save HTML file
-        html_path = os.path.join(output_dir, 'index.html')
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"HTML dashboard generated: {html_path}")
+    if args.upcoming or args.date_from or args.date_until:
+        first = args.date_from or (date.today() if args.upcoming else date.min)
+        events = filter_by_date(events, first, args.date_until or date.max)
+    
+    if not events:
+        logger.error("No events found. Exiting...")
+        return False
+    
+    # Generate dashboard
+    dashboard = DashboardGenerator(events)
+    
+    # Only regenerate outputs built from a different set of events
+    formats = args.formats
+    if store is not None:
+        fingerprint = EventStore.set_fingerprint(events)
+        paths = {fmt: os.path.join(output_dir, DashboardGenerator.OUTPUT_FILES[fmt]) for fmt in formats}
+        if not args.force:
+            formats = [fmt for fmt in formats if not store.output_is_current(paths[fmt], fingerprint)]
+            for fmt in args.formats:
+                if fmt not in formats:
+                    logger.info(f"{paths[fmt]} is up to date, skipping")
+    
+    # Save to different formats in one pass over the events
+    if formats:
+        dashboard.export(output_dir, formats)
+    if store is not None:
+        for fmt in formats:
+            store.mark_output(paths[fmt], fingerprint)
+    return True
 
-def main():
+def main(argv=None):
     """Main function to run the events aggregator"""
+    args = parse_args(argv)
     logger.info("Starting Events Aggregator...")
     
     # Create output directories
-    output_dir = Path('output')
+    output_dir = Path(setting('OUTPUT_DIR'))
     output_dir.mkdir(exist_ok=True)
     
     # Initialize scraper and scrape events
-    scraper = EventsScraper()
-    events = scraper.scrape_all_platforms()
+    scraper = EventsScraper(refresh=args.refresh)
+    if args.sync:
+        events = scraper.scrape_all_platforms()
+    else:
+        events = asyncio.run(scraper.scrape_all_platforms_async())
     
-    if not events:
-        logger.error("No events found. Exiting...")
+    store = EventStore(setting('EVENT_STORE')) if setting('EVENT_STORE') else None
+    try:
+        exported = export_events(args, events, store, output_dir)
+        
+        # Outputs are written; let stale platforms finish refreshing their snapshots
+        refreshed = scraper.wait_for_refreshes()
+        
+        # Record everything scraped, before deduplication and filtering. Events
+        # served from a snapshot were recorded by the run that scraped them and
+        # don't count as seen again.
+        if store is not None:
+            seen = [event for event in events if event.platform in scraper.live_platforms] + refreshed
+            changes = store.record_run(seen)
+            logger.info(f"Event store: {changes.inserted} new, {changes.updated} updated, "
+                        f"{changes.unchanged} unchanged")
+    finally:
+        if store is not None:
+            store.close()
+    if not exported:
         return
     
-    # Generate dashboard
-    dashboard = DashboardGenerator(events)
-    
-    # Save to different formats
-    dashboard.save_to_json(output_dir / 'events.json')
-    dashboard.save_to_markdown(output_dir / 'events.md')
-    dashboard.generate_html_dashboard(str(output_dir))
-    
     logger.info("Events aggregation completed successfully!")
-    logger.info(f"Check the 'output' directory for generated files:")
-    logger.info(f"- events.json: Raw event data")
-    logger.info(f"- events.md: Markdown formatted events")
-    logger.info(f"- index.html: Interactive dashboard")
+    logger.info(f"Check the '{output_dir}' directory for generated files:")
+    descriptions = {
+        'json': 'Raw event data',
+        'ndjson': 'One event per line',
+        'markdown': 'Markdown formatted events',
+        'html': 'Interactive dashboard',
+        'sharded': 'Virtualized dashboard for large event sets'
+    }
+    for fmt in args.formats:
+        logger.info(f"- {DashboardGenerator.OUTPUT_FILES[fmt]}: {descriptions[fmt]}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
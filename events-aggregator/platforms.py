@@ -0,0 +1,187 @@
+"""
+Platform adapters for the events scraper
+
+Each adapter knows one platform's listing URL(s) and how to turn a listing
+page into events. Listings are walked page by page and events are yielded
+as soon as a page is parsed, so callers can stream a whole catalog or stop
+after the first few events without fetching the rest.
+"""
+
+import logging
+import sys
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Type
+
+from bs4 import BeautifulSoup
+
+from dates import iso_span
+from events import Event
+
+logger = logging.getLogger(__name__)
+
+PLATFORM_ADAPTERS: Dict[str, Type['PlatformAdapter']] = {}
+
+def register_platform(key: str):
+    """Class decorator adding an adapter to the registry under a config key"""
+    def decorator(cls):
+        cls.key = key
+        PLATFORM_ADAPTERS[key] = cls
+        return cls
+    return decorator
+
+class PlatformAdapter:
+    """Base class: fetch listing pages, parse them into events
+
+    Subclasses set `platform`, `category` and `url` (a single page) or
+    `page_url` (a format string with `{page}`, 1-based), and implement
+    parse_page(), building events with make_event() and the scraped_at it
+    is given. Pagination stops at the first page with no events, at a
+    page identical to the previous one (sites that ignore the page
+    parameter), or after max_pages.
+    """
+
+    key = ''
+    platform = ''
+    category = ''
+    url: Optional[str] = None
+    page_url: Optional[str] = None
+
+    @property
+    def scrapable(self) -> bool:
+        return bool(self.url or self.page_url)
+
+    def page_urls(self, max_pages: Optional[int] = None) -> Iterator[str]:
+        if self.page_url is None:
+            if self.url:
+                yield self.url
+            return
+        page = 1
+        while max_pages is None or page <= max_pages:
+            yield self.page_url.format(page=page)
+            page += 1
+
+    def parse_page(self, content: bytes, scraped_at: str) -> List[Event]:
+        raise NotImplementedError
+
+    def make_event(self, title: str, dates: str, organizer: str, scraped_at: str) -> Event:
+        # Parsed from dates; None when it has no date ("Dates TBA")
+        start_date, end_date = iso_span(dates)
+        # Listings repeat dates and organizers; keep one copy of each
+        return Event(title, sys.intern(dates), start_date, end_date, sys.intern(organizer),
+                     self.category, self.platform, scraped_at)
+
+    def _new_page(self, events: List[Event], previous: Optional[tuple]) -> Optional[tuple]:
+        """Identity of a parsed page, or None when pagination should stop"""
+        if not events:
+            return None
+        identity = tuple(event.title for event in events)
+        return None if identity == previous else identity
+
+    def iter_events(self, fetch: Callable[[str], bytes], max_pages: Optional[int] = None,
+                    scraped_at: Optional[str] = None) -> Iterator[Event]:
+        """Yield events page by page, fetching each page only when needed
+
+        Every event gets the same scraped_at (default: when iteration starts).
+        """
+        scraped_at = scraped_at or datetime.now().isoformat()
+        previous = None
+        for url in self.page_urls(max_pages):
+            events = self.parse_page(fetch(url), scraped_at)
+            previous = self._new_page(events, previous)
+            if previous is None:
+                return
+            yield from events
+
+    async def aiter_events(self, fetch: Callable[[str], Awaitable[bytes]], max_pages: Optional[int] = None,
+                           scraped_at: Optional[str] = None) -> AsyncIterator[Event]:
+        """Async version of iter_events"""
+        scraped_at = scraped_at or datetime.now().isoformat()
+        previous = None
+        for url in self.page_urls(max_pages):
+            events = self.parse_page(await fetch(url), scraped_at)
+            previous = self._new_page(events, previous)
+            if previous is None:
+                return
+            for event in events:
+                yield event
+
+def _text(element, default: str) -> str:
+    return element.get_text(strip=True) if element else default
+
+@register_platform('devpost')
+class DevpostAdapter(PlatformAdapter):
+    platform = 'Devpost'
+    category = 'Hackathon'
+    page_url = "https://devpost.com/hackathons?page={page}"
+
+    def parse_page(self, content: bytes, scraped_at: str) -> List[Event]:
+        events = []
+        soup = BeautifulSoup(content, 'html.parser')
+        for item in soup.find_all('div', class_='hackathon-tile'):
+            try:
+                title = _text(item.find('h3') or item.find('h2') or item.find('a'), "N/A")
+                dates = _text(item.find('div', class_='date-range') or item.find('time'), "Dates TBA")
+                organizer = _text(item.find('div', class_='organizer') or item.find('.sponsor-name'),
+                                  "Devpost Community")
+                events.append(self.make_event(title, dates, organizer, scraped_at))
+            except Exception as e:
+                logger.warning(f"Error parsing Devpost item: {e}")
+        return events
+
+@register_platform('mlh')
+class MLHAdapter(PlatformAdapter):
+    platform = 'MLH'
+    category = 'Hackathon'
+    # The season page lists every event on one page
+    url = "https://mlh.io/seasons/2025/events"
+
+    def parse_page(self, content: bytes, scraped_at: str) -> List[Event]:
+        events = []
+        soup = BeautifulSoup(content, 'html.parser')
+        for item in soup.find_all('div', class_='event') or soup.find_all('div', class_='hackathon'):
+            try:
+                title = _text(item.find('h3') or item.find('h2') or item.find('a'), "N/A")
+                dates = _text(item.find('div', class_='date') or item.find('time'), "Dates TBA")
+                organizer = _text(item.find('div', class_='location') or item.find('.university'),
+                                  "MLH Community")
+                events.append(self.make_event(title, dates, organizer, scraped_at))
+            except Exception as e:
+                logger.warning(f"Error parsing MLH item: {e}")
+        return events
+
+@register_platform('scaler')
+class ScalerAdapter(PlatformAdapter):
+    platform = 'Scaler'
+    category = 'EdTech Workshop'
+    url = "https://www.scaler.com/events/"
+
+    def parse_page(self, content: bytes, scraped_at: str) -> List[Event]:
+        events = []
+        soup = BeautifulSoup(content, 'html.parser')
+        for card in soup.find_all('div', class_='event-card') or soup.find_all('div', class_='card'):
+            try:
+                title = _text(card.find('h3') or card.find('h2'), "Scaler Event")
+                dates = _text(card.find('div', class_='date') or card.find('time'), "Upcoming")
+                events.append(self.make_event(title, dates, 'Scaler', scraped_at))
+            except Exception as e:
+                logger.warning(f"Error parsing Scaler event: {e}")
+        return events
+
+@register_platform('unacademy')
+class UnacademyAdapter(PlatformAdapter):
+    platform = 'Unacademy'
+    category = 'Bootcamp'
+    # Not scraped yet: no listing URL, so it contributes no events
+
+def enabled_platforms(platforms: Dict[str, Any]) -> List[PlatformAdapter]:
+    """Adapters for the platforms switched on in config.PLATFORMS, in config order"""
+    adapters = []
+    for key, enabled in platforms.items():
+        if not enabled:
+            continue
+        adapter_cls = PLATFORM_ADAPTERS.get(key)
+        if adapter_cls is None:
+            logger.warning(f"Unknown platform in config: {key}")
+            continue
+        adapters.append(adapter_cls())
+    return adapters
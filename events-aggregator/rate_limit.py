@@ -0,0 +1,70 @@
+"""
+Per-domain token-bucket rate limiting for the events scrapers
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+class TokenBucket:
+    """Allows `rate` requests per second on average, with bursts up to `capacity`
+
+    Callers reserve a token and are told how long to wait for it, so
+    concurrent callers queue up in arrival order instead of all waking at
+    once. Usable from threads (acquire) and from asyncio (acquire_async).
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return the seconds to wait before using it"""
+        if self.rate == float('inf'):
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            # A negative balance is a slot in the future
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+class DomainRateLimiter:
+    """One token bucket per host, so each site sees at most one request per
+    `delay` seconds while different sites are fetched in parallel"""
+
+    def __init__(self, delay: float = 2, burst: float = 1):
+        self.rate = 1 / delay if delay > 0 else float('inf')
+        self.burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def acquire(self, url: str):
+        self.bucket(url).acquire()
+
+    async def acquire_async(self, url: str):
+        await self.bucket(url).acquire_async()
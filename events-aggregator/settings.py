@@ -0,0 +1,35 @@
+"""
+Settings read from config.py (generated by setup.py), with defaults for
+anything it doesn't define
+"""
+
+try:
+    import config
+except ImportError:
+    config = None
+
+DEFAULTS = {
+    'SCRAPING_DELAY': 2,
+    'MAX_EVENTS_PER_PLATFORM': 10,
+    'MAX_PAGES_PER_PLATFORM': None,
+    'TIMEOUT': 10,
+    'DEDUPLICATE': True,
+    'OUTPUT_DIR': 'output',
+    'LOG_LEVEL': 'INFO',
+    'EVENT_STORE': 'data/events.db',
+    'SNAPSHOT_DIR': 'data/snapshots',
+    'SNAPSHOT_TTL': 3600,
+    'SNAPSHOT_MAX_STALE': 7 * 86400,
+    'PLATFORMS': {
+        'devpost': True,
+        'mlh': True,
+        'scaler': True,
+        'unacademy': True
+    },
+    'DASHBOARD_TITLE': 'Events Dashboard',
+    'DASHBOARD_SUBTITLE': 'Discover the latest hackathons, bootcamps, and tech events'
+}
+
+def setting(name: str):
+    """Value of a config.py setting, or its default"""
+    return getattr(config, name, DEFAULTS[name])
@@ -40,12 +40,18 @@ def create_config_file():
 
 # Scraping settings
 SCRAPING_DELAY = 2  # seconds between requests
-MAX_EVENTS_PER_PLATFORM = 10
+MAX_EVENTS_PER_PLATFORM = 10  # None pulls each platform's full catalog
+MAX_PAGES_PER_PLATFORM = None  # listing pages per platform, None = until exhausted
 TIMEOUT = 10  # seconds
+DEDUPLICATE = True  # merge the same event listed on several platforms
 
 # Output settings
 OUTPUT_DIR = "output"
 LOG_LEVEL = "INFO"
+EVENT_STORE = "data/events.db"  # SQLite history of scraped events, None disables
+SNAPSHOT_DIR = "data/snapshots"  # last successful scrape per platform, None disables
+SNAPSHOT_TTL = 3600  # seconds a snapshot is served without scraping
+SNAPSHOT_MAX_STALE = 604800  # seconds a snapshot is served while refreshing in the background
 
 # Platform settings
 PLATFORMS = {
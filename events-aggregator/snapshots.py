@@ -0,0 +1,83 @@
+"""
+Last-known-good platform snapshots
+
+Every successful scrape of a platform is saved as a snapshot. A later run
+uses the snapshot according to its age:
+
+- fresh (younger than ttl): served as is, the platform isn't fetched
+- stale (younger than max_stale): served at once while a background
+  refresh scrapes the platform and saves a new snapshot
+- expired or missing: the platform is scraped; if that fails, any
+  snapshot, however old, is served instead of nothing
+"""
+
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from events import Event
+
+logger = logging.getLogger(__name__)
+
+FRESH = 'fresh'
+STALE = 'stale'
+EXPIRED = 'expired'
+
+class Snapshot:
+    """One platform's events as of its last successful scrape"""
+
+    def __init__(self, events: List[Event], saved_at: float, ttl: float, max_stale: float):
+        self.events = events
+        self.saved_at = saved_at
+        self.ttl = ttl
+        self.max_stale = max_stale
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.saved_at
+
+    @property
+    def state(self) -> str:
+        age = self.age
+        if age < self.ttl:
+            return FRESH
+        if age < self.max_stale:
+            return STALE
+        return EXPIRED
+
+class SnapshotCache:
+    """Snapshots stored as one JSON file per platform key in `directory`"""
+
+    def __init__(self, directory: str = 'data/snapshots', ttl: float = 3600, max_stale: float = 7 * 86400):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_stale = max_stale
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f'{key}.json'
+
+    def get(self, key: str) -> Optional[Snapshot]:
+        """The platform's snapshot, or None if there is none (or it's unreadable)"""
+        try:
+            with open(self._path(key), encoding='utf-8') as f:
+                data = json.load(f)
+            events = [Event.from_dict(event) for event in data['events']]
+            return Snapshot(events, data['saved_at'], self.ttl, self.max_stale)
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable snapshot for {key}: {e}")
+            return None
+
+    def put(self, key: str, events: List[Event]):
+        """Save a successful scrape; readers see the old or the new snapshot, never half of one"""
+        path = self._path(key)
+        temp = path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump({'saved_at': time.time(), 'events': [event.to_dict() for event in events]}, f,
+                      ensure_ascii=False)
+        os.replace(temp, path)
@@ -0,0 +1,17 @@
+import os
+import sys
+from datetime import date
+
+# Add the events-aggregator directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dates import iso_span
+
+def test_iso_span_resolves_yearless_dates_in_the_reference_year():
+    assert iso_span("Mar 14-16", 2025) == ('2025-03-14', '2025-03-16')
+    # Same text, cached under the other year
+    assert iso_span("Mar 14-16", 2026) == ('2026-03-14', '2026-03-16')
+    assert iso_span("Mar 14-16") == iso_span("Mar 14-16", date.today().year)
+
+def test_iso_span_of_text_without_a_date():
+    assert iso_span("Dates TBA", 2025) == (None, None)
@@ -0,0 +1,39 @@
+import os
+import sys
+
+# Add the events-aggregator directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dedup import EventDeduplicator, deduplicate
+from events import Event
+
+def listing(title, platform, dates="Mar 14-16, 2025"):
+    return Event(title, dates, '2025-03-14', '2025-03-16', 'Organizer', 'Hackathon', platform,
+                 '2025-03-01T00:00:00')
+
+def test_cross_platform_duplicates_are_merged():
+    events = [listing("Quantum Jam 2025", 'Devpost'), listing("Quantum Jam", 'MLH')]
+
+    merged = deduplicate(events)
+
+    assert len(merged) == 1
+    assert merged[0].platforms == ['Devpost', 'MLH']
+
+def test_a_chain_of_matches_never_merges_listings_of_one_platform():
+    # The MLH listing is similar to both Devpost listings, which are two
+    # different events on the same platform
+    events = [
+        listing("Quantum Jam East", 'Devpost'),
+        listing("Quantum Jam West", 'Devpost'),
+        listing("Quantum Jam", 'MLH'),
+        listing("Orbital Build Week", 'Devpost'),
+    ]
+
+    groups = EventDeduplicator().groups(events)
+
+    assert sorted(groups) == [[0, 2], [1], [3]]
+    for group in groups:
+        platforms = [events[index].platform for index in group]
+        assert len(platforms) == len(set(platforms))
+    assert [event.title for event in deduplicate(events)] == [
+        "Quantum Jam East", "Quantum Jam West", "Orbital Build Week"]
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Parser backend benchmark
+Times parsing (and headline selection) of saved HTML pages with every
+installed parser backend.
+
+Usage:
+    python benchmarks/bench_parsers.py                   # all fixtures in benchmarks/fixtures/
+    python benchmarks/bench_parsers.py page1.html ...    # specific files
+    python benchmarks/bench_parsers.py --synthetic 500   # generated page with 500 articles
+"""
+
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+# Add src directory to Python path
+src_path = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, src_path)
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fixtures import FIXTURES_DIR, build_synthetic_page
+from scrapers.parsers import available_backends, parse_html
+
+# Union of the selectors used by the bundled scrapers
+SELECTORS = [
+    'h3[data-testid="card-headline"]',
+    'h3.gs-c-promo-heading__title',
+    'a[data-testid="internal-link"] h3',
+    '.top-newslist li a',
+    '.story-link',
+    'article h3 a',
+    'h3.article-card__title a'
+]
+
+def time_call(func, repeat: int) -> float:
+    """Median wall time of func() in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def benchmark_page(label: str, content: bytes, repeat: int):
+    print(f"\n{label} ({len(content) / 1024:.0f} KiB)")
+    print(f"  {'backend':<12} {'parse ms':>10} {'parse+select ms':>16}")
+
+    for backend in available_backends():
+        def parse():
+            return parse_html(content, backend)
+
+        def parse_and_select():
+            document = parse_html(content, backend)
+            for selector in SELECTORS:
+                document.select(selector)
+
+        parse_ms = time_call(parse, repeat)
+        total_ms = time_call(parse_and_select, repeat)
+        print(f"  {backend:<12} {parse_ms:>10.2f} {total_ms:>16.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends")
+    parser.add_argument('files', nargs='*', help="HTML files to parse (default: benchmarks/fixtures/*.html)")
+    parser.add_argument('--synthetic', type=int, metavar='ARTICLES',
+                        help="benchmark a generated page with this many articles")
+    parser.add_argument('--repeat', type=int, default=10, help="runs per measurement (default: 10)")
+    args = parser.parse_args()
+
+    pages = []
+    if args.synthetic:
+        pages.append((f"synthetic[{args.synthetic}]", build_synthetic_page(args.synthetic)))
+
+    files = args.files or ([] if args.synthetic else sorted(glob.glob(os.path.join(FIXTURES_DIR, '*.html'))))
+    for path in files:
+        with open(path, 'rb') as f:
+            pages.append((os.path.basename(path), f.read()))
+
+    if not pages:
+        print(f"No fixtures found in {FIXTURES_DIR}; pass HTML files or use --synthetic N")
+        sys.exit(1)
+
+    print(f"Backends: {', '.join(available_backends())}")
+    for label, content in pages:
+        benchmark_page(label, content, args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Offline scraper benchmark
+Runs each source's real scrape_headlines() against recorded fixtures (see
+benchmarks/fixtures.py) and reports throughput, latency and allocations.
+
+Usage:
+    python benchmarks/fixtures.py synthetic               # or: fixtures.py record
+    python benchmarks/bench_scrapers.py
+    python benchmarks/bench_scrapers.py --parser selectolax --streaming
+    python benchmarks/bench_scrapers.py --save baseline.json
+    python benchmarks/bench_scrapers.py --compare baseline.json   # exit 1 on regression
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+# Add src directory to Python path
+src_path = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, src_path)
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fixtures import FIXTURES_DIR, load_fixtures, replay_session
+from scrapers.registry import load_scraper_class
+
+def benchmark_source(name: str, meta: dict, session, args) -> dict:
+    scraper = load_scraper_class(name)()
+    scraper.session = session
+    scraper.parser = args.parser
+    scraper.streaming = args.streaming
+
+    with open(meta['path'], 'rb') as f:
+        body = f.read()
+
+    # Warm up caches (compiled selectors, parser imports)
+    headlines = scraper.scrape_headlines()
+
+    samples = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        scraper.scrape_headlines()
+        samples.append(time.perf_counter() - start)
+
+    parse_samples = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        scraper.parse(body)
+        parse_samples.append(time.perf_counter() - start)
+
+    # Memory blocks kept alive by one parsed document
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    document = scraper.parse(body)
+    blocks = sys.getallocatedblocks() - blocks_before
+    del document
+
+    # Peak traced memory of one full scrape
+    gc.collect()
+    tracemalloc.start()
+    scraper.scrape_headlines()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'source': name,
+        'page_kib': round(len(body) / 1024, 1),
+        'headlines': len(headlines),
+        'pages_per_sec': round(len(samples) / sum(samples), 2),
+        'ms_per_page': round(statistics.median(samples) * 1000, 3),
+        'ms_per_parse': round(statistics.median(parse_samples) * 1000, 3),
+        'blocks_per_parse': blocks,
+        'peak_kib_per_page': round(peak / 1024, 1)
+    }
+
+def compare(results: list, baseline_path: str, max_regression: float) -> bool:
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {entry['source']: entry for entry in json.load(f)['results']}
+
+    ok = True
+    print(f"\nComparison with {baseline_path} (max regression {max_regression:.0%}):")
+    for entry in results:
+        previous = baseline.get(entry['source'])
+        if not previous:
+            continue
+        change = entry['ms_per_page'] / previous['ms_per_page'] - 1
+        status = 'REGRESSION' if change > max_regression else 'ok'
+        ok = ok and status == 'ok'
+        print(f"  {entry['source']:<12} {previous['ms_per_page']:>9.2f} -> {entry['ms_per_page']:>9.2f} ms  "
+              f"({change:+.0%}) {status}")
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scrapers offline against recorded fixtures")
+    parser.add_argument('--sources', help="comma-separated sources (default: every recorded fixture)")
+    parser.add_argument('--parser', default='auto', help="parser backend (default: auto)")
+    parser.add_argument('--streaming', action='store_true', help="use streaming extraction")
+    parser.add_argument('--repeat', type=int, default=20, help="timed runs per source (default: 20)")
+    parser.add_argument('--dir', default=FIXTURES_DIR, help="fixture directory")
+    parser.add_argument('--save', metavar='PATH', help="write results as JSON")
+    parser.add_argument('--compare', metavar='PATH', help="compare ms/page with a saved baseline")
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help="allowed ms/page slowdown vs baseline (default: 0.25)")
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.dir)
+    if args.sources:
+        names = [name.strip() for name in args.sources.split(',') if name.strip()]
+        fixtures = {name: fixtures[name] for name in names if name in fixtures}
+    if not fixtures:
+        print(f"No fixtures in {args.dir}; run benchmarks/fixtures.py record (or synthetic) first")
+        sys.exit(1)
+
+    session = replay_session(fixtures)
+    results = [benchmark_source(name, meta, session, args) for name, meta in fixtures.items()]
+
+    mode = f"parser={args.parser}{', streaming' if args.streaming else ''}"
+    print(f"Offline scraper benchmark ({mode}, {args.repeat} runs)")
+    print(f"  {'source':<12} {'KiB':>7} {'hl':>3} {'pages/s':>9} {'ms/page':>9} {'ms/parse':>9} "
+          f"{'blocks/parse':>13} {'peak KiB':>9}")
+    for entry in results:
+        print(f"  {entry['source']:<12} {entry['page_kib']:>7.0f} {entry['headlines']:>3} "
+              f"{entry['pages_per_sec']:>9.1f} {entry['ms_per_page']:>9.2f} {entry['ms_per_parse']:>9.2f} "
+              f"{entry['blocks_per_parse']:>13} {entry['peak_kib_per_page']:>9.0f}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'mode': mode, 'results': results}, f, indent=2)
+        print(f"\nResults saved to {args.save}")
+
+    if args.compare and not compare(results, args.compare, args.max_regression):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
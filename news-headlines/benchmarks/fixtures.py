@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Record/replay HTML fixtures for offline scraper benchmarks
+
+Recording saves each source's front page to benchmarks/fixtures/<source>.html
+with a <source>.json sidecar (URL, status, headers). Replaying mounts a
+requests transport adapter that answers from those files, so scrapers run
+their normal fetch/parse/select code without touching the network.
+
+Usage:
+    python benchmarks/fixtures.py record                  # all default sources
+    python benchmarks/fixtures.py record --sources bbc
+    python benchmarks/fixtures.py synthetic --articles 300
+    python benchmarks/fixtures.py list
+"""
+
+import argparse
+import glob
+import io
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+# Add src directory to Python path
+src_path = os.path.join(os.path.dirname(__file__), '..', 'src')
+sys.path.insert(0, src_path)
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from scrapers.registry import DEFAULT_SOURCES, create_scrapers, load_scraper_class
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+
+def build_synthetic_page(articles: int) -> bytes:
+    """Build a news-homepage-like document matching the bundled scrapers' selectors"""
+    parts = ['<!DOCTYPE html><html><head><title>Synthetic</title></head><body>']
+    parts.append('<nav>' + ''.join(f'<a href="/section/{i}">Section {i}</a>' for i in range(40)) + '</nav>')
+    parts.append('<main><ul class="top-newslist">')
+    for i in range(articles):
+        parts.append(
+            f'<li><article class="card"><a data-testid="internal-link" href="/news/articles/{i}">'
+            f'<h3 data-testid="card-headline">Synthetic headline number {i} about world events</h3></a>'
+            f'<h3 class="article-card__title"><a href="/news/{i}">Synthetic feature story number {i}</a></h3>'
+            f'<p class="summary">Summary text for article {i}. ' + 'Lorem ipsum dolor sit amet. ' * 5 + '</p>'
+            '</article></li>'
+        )
+    parts.append('</ul></main><footer>' + '<div><span>footer</span></div>' * 50 + '</footer></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+def _save_fixture(name: str, url: str, body: bytes, headers: Dict[str, str], directory: str):
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"{name}.html"), 'wb') as f:
+        f.write(body)
+    with open(os.path.join(directory, f"{name}.json"), 'w', encoding='utf-8') as f:
+        json.dump({
+            'source': name,
+            'url': url,
+            'status': 200,
+            'headers': headers,
+            'recorded_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        }, f, indent=2)
+
+def record(names: List[str], directory: str = FIXTURES_DIR):
+    """Download each source's front page and store it as a fixture"""
+    for name, scraper in zip(names, create_scrapers(names)):
+        response = scraper.session.get(scraper.base_url, timeout=10)
+        response.raise_for_status()
+        headers = {key: response.headers[key] for key in ('Content-Type',) if key in response.headers}
+        _save_fixture(name, scraper.base_url, response.content, headers, directory)
+        print(f"Recorded {name}: {len(response.content) / 1024:.0f} KiB from {scraper.base_url}")
+
+def record_synthetic(names: List[str], articles: int, directory: str = FIXTURES_DIR):
+    """Store a generated page as the fixture for each source"""
+    body = build_synthetic_page(articles)
+    for name in names:
+        scraper = load_scraper_class(name)()
+        _save_fixture(name, scraper.base_url, body, {'Content-Type': 'text/html; charset=utf-8'}, directory)
+        print(f"Generated {name}: {len(body) / 1024:.0f} KiB synthetic page")
+
+def load_fixtures(directory: str = FIXTURES_DIR) -> Dict[str, Dict]:
+    """Recorded fixtures by source name: {'url', 'headers', 'path', ...}"""
+    fixtures = {}
+    for meta_path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        meta['path'] = meta_path[:-len('.json')] + '.html'
+        if os.path.exists(meta['path']):
+            fixtures[meta['source']] = meta
+    return fixtures
+
+class ReplayAdapter(BaseAdapter):
+    """requests transport adapter that serves recorded fixtures by URL"""
+
+    def __init__(self, fixtures: Dict[str, Dict]):
+        super().__init__()
+        self.by_url = {meta['url']: meta for meta in fixtures.values()}
+        self._bodies: Dict[str, bytes] = {}
+
+    def _body(self, meta: Dict) -> bytes:
+        body = self._bodies.get(meta['path'])
+        if body is None:
+            with open(meta['path'], 'rb') as f:
+                body = f.read()
+            self._bodies[meta['path']] = body
+        return body
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        meta = self.by_url.get(request.url)
+        if meta is None:
+            raise requests.ConnectionError(f"No fixture recorded for {request.url}", request=request)
+
+        body = self._body(meta)
+        response = requests.Response()
+        response.status_code = meta.get('status', 200)
+        response.headers = CaseInsensitiveDict(meta.get('headers', {}))
+        response.headers['Content-Length'] = str(len(body))
+        response.raw = io.BytesIO(body)
+        response.url = request.url
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.reason = 'OK'
+        response.connection = self
+        return response
+
+    def close(self):
+        self._bodies.clear()
+
+def replay_session(fixtures: Optional[Dict[str, Dict]] = None) -> requests.Session:
+    """A session whose HTTP(S) requests are answered from fixtures"""
+    adapter = ReplayAdapter(fixtures if fixtures is not None else load_fixtures())
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or generate HTML fixtures for offline benchmarks")
+    parser.add_argument('command', choices=['record', 'synthetic', 'list'])
+    parser.add_argument('--sources', default=','.join(DEFAULT_SOURCES),
+                        help="comma-separated sources (default: all default sources)")
+    parser.add_argument('--articles', type=int, default=300, help="synthetic: articles per page (default: 300)")
+    parser.add_argument('--dir', default=FIXTURES_DIR, help="fixture directory")
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.sources.split(',') if name.strip()]
+    if args.command == 'record':
+        record(names, args.dir)
+    elif args.command == 'synthetic':
+        record_synthetic(names, args.articles, args.dir)
+    else:
+        for name, meta in load_fixtures(args.dir).items():
+            size = os.path.getsize(meta['path']) / 1024
+            print(f"{name:<12} {size:>7.0f} KiB  {meta['recorded_at']}  {meta['url']}")
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,9 @@
 """
 News Headlines Scraper - Entry Point
 Run this script to fetch latest headlines from major news sources
+
+    python run.py             # one-shot run
+    python run.py --daemon    # keep polling with adaptive per-source intervals
 """
 
 import sys
@@ -0,0 +1,125 @@
+import heapq
+import threading
+import time
+from typing import Dict, List, Optional
+
+from utils.headline_store import HeadlineStore
+
+class SourceSchedule:
+    """Polling state of a single news source"""
+
+    def __init__(self, scraper, interval: float):
+        self.scraper = scraper
+        self.interval = interval
+        self.next_run = 0.0
+        self.last_keys = frozenset()
+        self.polls = 0
+        self.changes = 0
+
+    def __lt__(self, other: 'SourceSchedule') -> bool:
+        return self.next_run < other.next_run
+
+class PollingDaemon:
+    """Long-running poller that schedules each source on an adaptive interval
+
+    Scrapers (and their HTTP sessions) live for the whole process, so
+    connections stay warm between polls. A source whose headlines changed
+    since its last poll is polled sooner next time (interval * speedup); an
+    unchanged or failing source backs off (interval * backoff). Intervals
+    stay within [min_interval, max_interval] seconds.
+    """
+
+    def __init__(self, aggregator, min_interval: float = 30, max_interval: float = 900,
+                 initial_interval: float = 60, speedup: float = 0.5, backoff: float = 1.5,
+                 snapshot_path: Optional[str] = 'output/headlines.json',
+                 metrics_path: Optional[str] = None):
+        self.aggregator = aggregator
+        self.logger = aggregator.logger
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.speedup = speedup
+        self.backoff = backoff
+        self.snapshot_path = snapshot_path
+        self.metrics_path = metrics_path
+        self.initial_interval = min(max(initial_interval, min_interval), max_interval)
+        self.latest: Dict[str, Dict] = {}
+        self._stop = threading.Event()
+
+    def stop(self):
+        """Ask the run loop to exit after the current poll"""
+        self._stop.set()
+
+    def run(self, max_cycles: Optional[int] = None):
+        """Poll sources until stopped (or for max_cycles scheduling rounds)"""
+        queue = [SourceSchedule(scraper, self.initial_interval) for scraper in self.aggregator.scrapers]
+        heapq.heapify(queue)
+        self.logger.info("Polling daemon started for %d sources", len(queue))
+
+        cycles = 0
+        try:
+            while queue and not self._stop.is_set():
+                delay = queue[0].next_run - time.monotonic()
+                if delay > 0 and self._stop.wait(delay):
+                    break
+
+                # Poll every source that is due together so they share the pool
+                now = time.monotonic()
+                due = []
+                while queue and queue[0].next_run <= now:
+                    due.append(heapq.heappop(queue))
+
+                self._poll(due)
+                for schedule in due:
+                    heapq.heappush(queue, schedule)
+
+                cycles += 1
+                if max_cycles is not None and cycles >= max_cycles:
+                    break
+        except KeyboardInterrupt:
+            self.logger.info("Polling daemon interrupted")
+
+        self.logger.info("Polling daemon stopped")
+
+    def _poll(self, due: List[SourceSchedule]):
+        sources = self.aggregator.fetch_sources([schedule.scraper for schedule in due])
+        finished = time.monotonic()
+
+        for schedule, source_data in zip(due, sources):
+            schedule.polls += 1
+            self.latest[schedule.scraper.name] = source_data
+
+            if source_data['status'] == 'success':
+                keys = frozenset(
+                    HeadlineStore.headline_key(h['title'], h.get('url', ''))
+                    for h in source_data['headlines']
+                )
+                changed = keys != schedule.last_keys
+                schedule.last_keys = keys
+            else:
+                changed = False
+
+            if schedule.polls == 1:
+                # First poll only establishes the baseline
+                status = 'baseline'
+            elif changed:
+                status = 'changed'
+                schedule.changes += 1
+                schedule.interval = max(self.min_interval, schedule.interval * self.speedup)
+            else:
+                status = 'unchanged'
+                schedule.interval = min(self.max_interval, schedule.interval * self.backoff)
+            schedule.next_run = finished + schedule.interval
+
+            self.logger.info(
+                "%s: %s, next poll in %.0fs", schedule.scraper.name, status, schedule.interval,
+                extra={'source': schedule.scraper.name, 'status': status, 'interval': schedule.interval}
+            )
+
+        results = self.aggregator.summarize(
+            [self.latest[scraper.name] for scraper in self.aggregator.scrapers if scraper.name in self.latest]
+        )
+        self.aggregator.save_to_store({'sources': sources})
+        if self.snapshot_path:
+            self.aggregator.save_to_json(results, self.snapshot_path)
+        if self.metrics_path:
+            self.aggregator.save_metrics(results, self.metrics_path)
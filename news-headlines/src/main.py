@@ -1,76 +1,165 @@
+import argparse
 import json
 import os
-import sys
-from typing import List, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 
-# Add current directory to path for imports
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
-
-from scrapers.bbc_scraper import BBCScraper
-from scrapers.times_of_india_scraper import TimesOfIndiaScraper
-from scrapers.aljazeera_scraper import AlJazeeraScraper
+from scrapers.registry import DEFAULT_SOURCES, available_scrapers, create_scrapers
+from utils.concurrency import HostLimiter
+from utils.dedup import HeadlineClusterer, cluster_sources
+from utils.headline_store import HeadlineStore
+from utils.http_client import HAS_HTTP2, build_session
+from utils.http_cache import ResponseCache
 from utils.logger import setup_logger
+from utils.metrics import to_prometheus
+from utils.resilience import CircuitBreaker, RetryPolicy
 
 class NewsAggregator:
     """Main class to aggregate news from multiple sources"""
     
-    def __init__(self):
+    def __init__(self, sources: Optional[List[str]] = None,
+                 concurrent: bool = True, max_workers: int = 8, per_host_limit: int = 2,
+                 cache_dir: str = 'output/.cache', cache_max_bytes: int = 50 * 1024 * 1024,
+                 parser: str = 'auto', streaming: bool = False,
+                 store_path: str = 'output/headlines.db',
+                 retries: int = 3, fetch_deadline: float = 20.0,
+                 breaker_threshold: int = 3, breaker_cooldown: float = 300.0,
+                 hedge_percentile: Optional[float] = None,
+                 parse_workers: int = 0,
+                 cluster_threshold: float = 0.5,
+                 pool_maxsize: Optional[int] = None, http2: bool = False):
         self.logger = setup_logger()
-        self.scrapers = [
-            BBCScraper(),
-            TimesOfIndiaScraper(),
-            AlJazeeraScraper()
-        ]
+        # Only the selected sources are imported and constructed
+        self.scrapers = create_scrapers(sources or DEFAULT_SOURCES)
+        # Concurrency settings: max_workers caps all in-flight sources,
+        # per_host_limit caps sources sharing the same host
+        self.concurrent = concurrent
+        self.max_workers = max(1, max_workers)
+        self.host_limiter = HostLimiter(per_host_limit)
+        
+        # One keep-alive session for all scrapers, so connections and TLS
+        # sessions are reused across sources and polls. Hedging can double
+        # the requests in flight per host.
+        if http2 and not HAS_HTTP2:
+            self.logger.warning("HTTP/2 needs httpx[http2]; falling back to HTTP/1.1")
+        if pool_maxsize is None:
+            pool_maxsize = per_host_limit * (2 if hedge_percentile else 1)
+        self.session = build_session(pool_connections=max(10, len(self.scrapers)),
+                                     pool_maxsize=max(1, pool_maxsize), http2=http2)
+        
+        # Conditional-request cache shared by all scrapers (cache_dir=None disables it)
+        self.cache = ResponseCache(cache_dir, cache_max_bytes) if cache_dir else None
+        for scraper in self.scrapers:
+            scraper.session = self.session
+            scraper.cache = self.cache
+            scraper.parser = parser
+            scraper.streaming = streaming
+            # Resilience: bounded retries, per-source circuit breaker, optional hedging
+            scraper.retry_policy = RetryPolicy(attempts=retries, deadline=fetch_deadline)
+            scraper.circuit_breaker = CircuitBreaker(breaker_threshold, breaker_cooldown)
+            scraper.hedge_percentile = hedge_percentile
+        
+        # parse_workers > 0 moves parsing to a process pool fed by the fetch threads
+        self.pipeline = None
+        if parse_workers > 0 and not streaming:
+            from pipeline import FetchParsePipeline
+            self.pipeline = FetchParsePipeline(self, parse_workers)
+        
+        # Groups the same story reported by several sources
+        self.clusterer = HeadlineClusterer(threshold=cluster_threshold)
+        
+        # Persistent deduplicated headline history (store_path=None disables it)
+        self.store = HeadlineStore(store_path) if store_path else None
+    
+    def _fetch_source(self, scraper) -> Dict:
+        """Fetch one source, converting unexpected failures into an error entry"""
+        self.logger.info("Fetching headlines from %s...", scraper.name, extra={'source': scraper.name})
+        
+        try:
+            with self.host_limiter.limit(scraper.base_url):
+                return scraper.get_headlines_with_metadata()
+        except Exception as e:
+            return {
+                'source': scraper.name,
+                'status': 'error',
+                'error': f"Unexpected error - {str(e)}",
+                'headlines': [],
+                'count': 0
+            }
+    
+    def fetch_sources(self, scrapers: List) -> List[Dict]:
+        """Fetch a subset of the sources (scrapers from self.scrapers)
+        
+        Fetches concurrently if enabled and returns one per-source data dict
+        per scraper, in the order given. Failures become error entries.
+        """
+        if self.pipeline:
+            sources = self.pipeline.run(scrapers)
+        elif not self.concurrent or len(scrapers) < 2:
+            sources = [self._fetch_source(scraper) for scraper in scrapers]
+        else:
+            workers = min(self.max_workers, len(scrapers))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='news-fetch') as executor:
+                sources = list(executor.map(self._fetch_source, scrapers))
+        
+        for source_data in sources:
+            if source_data['status'] == 'success':
+                self.logger.info("✓ %s: %d headlines", source_data['source'], source_data['count'],
+                                 extra={'source': source_data['source'], 'count': source_data['count']})
+            else:
+                self.logger.error("✗ %s: %s", source_data['source'], source_data.get('error', 'Unknown error'),
+                                  extra={'source': source_data['source']})
+        return sources
     
     def fetch_all_headlines(self) -> Dict:
         """Fetch headlines from all news sources"""
         self.logger.info("Starting news aggregation...")
-        
+        return self.summarize(self.fetch_sources(self.scrapers))
+    
+    def summarize(self, sources: List[Dict]) -> Dict:
+        """Build the aggregated results document from per-source data"""
         results = {
             'timestamp': None,
             'sources': [],
             'total_headlines': 0,
+            'unique_headlines': 0,
             'successful_sources': 0,
-            'failed_sources': 0
+            'failed_sources': 0,
+            'clusters': []
         }
         
-        for scraper in self.scrapers:
-            self.logger.info(f"Fetching headlines from {scraper.name}...")
+        for source_data in sources:
+            results['sources'].append(source_data)
             
-            try:
-                source_data = scraper.get_headlines_with_metadata()
-                results['sources'].append(source_data)
-                
-                if source_data['status'] == 'success':
-                    results['successful_sources'] += 1
-                    results['total_headlines'] += source_data['count']
-                    self.logger.info(f"✓ {scraper.name}: {source_data['count']} headlines")
-                else:
-                    results['failed_sources'] += 1
-                    self.logger.error(f"✗ {scraper.name}: {source_data.get('error', 'Unknown error')}")
-                    
-            except Exception as e:
+            if source_data['status'] == 'success':
+                results['successful_sources'] += 1
+                results['total_headlines'] += source_data['count']
+            else:
                 results['failed_sources'] += 1
-                self.logger.error(f"✗ {scraper.name}: Unexpected error - {str(e)}")
-                results['sources'].append({
-                    'source': scraper.name,
-                    'status': 'error',
-                    'error': str(e),
-                    'headlines': [],
-                    'count': 0
-                })
+        
+        # Near-duplicates across sources; each cluster counts as one story
+        results['clusters'] = cluster_sources(results['sources'], self.clusterer)
+        results['unique_headlines'] = results['total_headlines'] - sum(
+            cluster['size'] - 1 for cluster in results['clusters'])
         
         # Set timestamp to the first successful scrape timestamp or current time
         successful_sources = [s for s in results['sources'] if s['status'] == 'success']
         if successful_sources:
             results['timestamp'] = successful_sources[0]['timestamp']
         else:
-            import time
             results['timestamp'] = time.strftime('%Y-%m-%d %H:%M:%S')
         
         return results
     
+    def close(self):
+        """Release pooled connections, the parse worker processes and the headline store, if any"""
+        self.session.close()
+        if self.pipeline:
+            self.pipeline.close()
+        if self.store:
+            self.store.close()
+    
     def save_to_json(self, data: Dict, filepath: str = 'output/headlines.json'):
         """Save headlines to JSON file"""
         try:
@@ -80,26 +169,118 @@ class NewsAggregator:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             
-            self.logger.info(f"Headlines saved to {filepath}")
+            self.logger.info("Headlines saved to %s", filepath)
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to save headlines: {str(e)}")
+            self.logger.error("Failed to save headlines: %s", e)
+            return False
+    
+    def export_metrics(self, data: Dict, fmt: str = 'prometheus') -> str:
+        """Per-source phase timings as Prometheus text or JSON"""
+        if fmt == 'json':
+            return json.dumps({
+                source_data['source']: dict(source_data.get('timings', {}), status=source_data['status'])
+                for source_data in data['sources']
+            }, indent=2)
+        if fmt == 'prometheus':
+            return to_prometheus(data)
+        raise ValueError(f"Unknown metrics format: {fmt}")
+    
+    def save_metrics(self, data: Dict, filepath: str) -> bool:
+        """Write metrics to a file, JSON if it ends in .json else Prometheus text"""
+        try:
+            directory = os.path.dirname(filepath)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            fmt = 'json' if filepath.endswith('.json') else 'prometheus'
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(self.export_metrics(data, fmt))
+            self.logger.info("Metrics saved to %s", filepath)
+            return True
+        except Exception as e:
+            self.logger.error("Failed to save metrics: %s", e)
             return False
+    
+    def save_to_store(self, data: Dict) -> int:
+        """Append headlines not seen before to the headline store"""
+        if not self.store:
+            return 0
+        
+        new_count = 0
+        for source_data in data['sources']:
+            if source_data['status'] != 'success':
+                continue
+            added = self.store.add_headlines(source_data['source'], source_data['headlines'],
+                                             source_data.get('timestamp'))
+            new_count += len(added)
+        
+        self.logger.info("Stored %d new headlines in %s", new_count, self.store.path)
+        return new_count
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch top headlines from major news sources")
+    parser.add_argument('--sources', type=lambda value: [name.strip() for name in value.split(',') if name.strip()],
+                        help=f"comma-separated sources to fetch (default: {','.join(DEFAULT_SOURCES)})")
+    parser.add_argument('--list-sources', action='store_true', help="list available sources and exit")
+    parser.add_argument('--metrics', metavar='PATH',
+                        help="write per-source phase timings (Prometheus text, or JSON for *.json)")
+    parser.add_argument('--parse-workers', type=int, default=0,
+                        help="parse pages in this many worker processes (default: 0, parse inline)")
+    parser.add_argument('--http2', action='store_true',
+                        help="use HTTP/2 where supported (needs httpx[http2])")
+    parser.add_argument('--log-json', action='store_true', help="write logs as JSON lines")
+    parser.add_argument('--log-queue', action='store_true',
+                        help="write logs from a background thread (always on with --daemon)")
+    parser.add_argument('--daemon', action='store_true',
+                        help="keep running and poll each source on an adaptive interval")
+    parser.add_argument('--min-interval', type=float, default=30,
+                        help="daemon: shortest polling interval in seconds (default: 30)")
+    parser.add_argument('--max-interval', type=float, default=900,
+                        help="daemon: longest polling interval in seconds (default: 900)")
+    return parser.parse_args(argv)
 
-def main():
+def main(argv=None):
     """Main function"""
-    aggregator = NewsAggregator()
+    args = parse_args(argv)
+    
+    if args.list_sources:
+        for name, target in sorted(available_scrapers().items()):
+            print(f"{name:<12} {target}")
+        return None
+    
+    # Configure logging before NewsAggregator picks up the logger
+    setup_logger(queued=args.log_queue or args.daemon, json_format=args.log_json)
+    aggregator = NewsAggregator(sources=args.sources, parse_workers=args.parse_workers,
+                                http2=args.http2)
+    try:
+        return run_aggregator(aggregator, args)
+    finally:
+        aggregator.close()
+
+def run_aggregator(aggregator: NewsAggregator, args):
+    """Run once (or as a daemon) and print a summary"""
+    
+    if args.daemon:
+        from daemon import PollingDaemon
+        PollingDaemon(aggregator, min_interval=args.min_interval, max_interval=args.max_interval,
+                      metrics_path=args.metrics).run()
+        return None
     
     # Fetch headlines
     headlines_data = aggregator.fetch_all_headlines()
     
-    # Save to JSON
+    # Append new headlines to the store and write the latest snapshot
+    new_headlines = aggregator.save_to_store(headlines_data)
     aggregator.save_to_json(headlines_data)
+    if args.metrics:
+        aggregator.save_metrics(headlines_data, args.metrics)
     
     # Print summary
     print(f"\n📊 Summary:")
     print(f"Total headlines: {headlines_data['total_headlines']}")
+    print(f"Unique stories: {headlines_data['unique_headlines']}")
+    print(f"New headlines: {new_headlines}")
     print(f"Successful sources: {headlines_data['successful_sources']}")
     print(f"Failed sources: {headlines_data['failed_sources']}")
     
@@ -0,0 +1,141 @@
+import multiprocessing
+import queue
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Dict, List, Optional
+
+from scrapers.base_scraper import SelectorCascade
+from scrapers.registry import load_scraper_class
+from utils.metrics import PhaseTimer
+
+# Scrapers rebuilt inside each parse worker process, by source name
+_worker_scrapers: Dict[str, object] = {}
+
+def parse_in_worker(source_key: str, parser: str, content: bytes):
+    """Parse a page and select its headlines (runs in a worker process)"""
+    scraper = _worker_scrapers.get(source_key)
+    if scraper is None:
+        scraper = load_scraper_class(source_key)()
+        _worker_scrapers[source_key] = scraper
+    scraper.parser = parser
+
+    timer = PhaseTimer()
+    with timer.activate():
+        headlines = scraper.parse_headlines(content)
+    return headlines, timer.durations
+
+class FetchParsePipeline:
+    """Two-stage pipeline: threads fetch raw pages, a process pool parses them
+
+    Fetching is I/O bound and runs on threads; BeautifulSoup parsing is CPU
+    bound and GIL limited, so it runs in parse_workers processes. Fetched
+    pages pass through a bounded queue: once max_pending pages are waiting to
+    be parsed, fetch threads block until the parse stage catches up.
+
+    Only scrapers that expose a SelectorCascade can be split that way.
+    Others (any scraper that just implements scrape_headlines()) are run
+    whole on a fetch thread, like without the pipeline.
+    """
+
+    def __init__(self, aggregator, parse_workers: int, max_pending: Optional[int] = None):
+        self.aggregator = aggregator
+        self.parse_workers = max(1, parse_workers)
+        self.max_pending = max_pending or self.parse_workers * 2
+        self._process_pool = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        # Created once and kept, so daemon polls don't pay process startup.
+        # 'spawn' because workers may start while fetch threads are running
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.parse_workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+        return self._process_pool
+
+    def close(self):
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+    @staticmethod
+    def splittable(scraper) -> bool:
+        """Whether the scraper's page can be fetched here and parsed in a worker"""
+        return isinstance(getattr(scraper, 'cascade', None), SelectorCascade)
+
+    def _fetch(self, index: int, scraper, pages: queue.Queue):
+        timer = PhaseTimer()
+        with timer.activate(), timer.phase('total'):
+            try:
+                with self.aggregator.host_limiter.limit(scraper.base_url):
+                    content = scraper.fetch_raw(scraper.base_url)
+                result = (index, content, timer, None)
+            except Exception as e:
+                result = (index, None, timer, e)
+        # Blocks while max_pending pages are already waiting (backpressure)
+        pages.put(result)
+
+    @staticmethod
+    def _parse_inline(scraper, content: bytes, timer: PhaseTimer) -> Dict:
+        try:
+            with timer.activate(), timer.phase('total'):
+                headlines = scraper.parse_headlines(content)
+            return scraper.build_metadata(headlines, timer)
+        except Exception as e:
+            return scraper.build_metadata([], timer, e)
+
+    def run(self, scrapers: List) -> List[Dict]:
+        """Fetch and parse the given sources, returning metadata in order"""
+        sources: List[Optional[Dict]] = [None] * len(scrapers)
+        pages: queue.Queue = queue.Queue(maxsize=self.max_pending)
+        split = [index for index, scraper in enumerate(scrapers) if self.splittable(scraper)]
+        pool = self._pool() if split else None
+        in_flight = {}
+        whole = {}
+
+        def collect(futures):
+            for future in futures:
+                index, timer = in_flight.pop(future)
+                scraper = scrapers[index]
+                try:
+                    headlines, durations = future.result()
+                except Exception as e:
+                    sources[index] = scraper.build_metadata([], timer, e)
+                    continue
+                for phase, seconds in durations.items():
+                    timer.add(phase, seconds)
+                    # Worker time also counts toward the source's total
+                    if phase in ('parse', 'select'):
+                        timer.add('total', seconds)
+                sources[index] = scraper.build_metadata(headlines, timer)
+
+        workers = min(self.aggregator.max_workers, len(scrapers)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='news-fetch') as fetchers:
+            for index, scraper in enumerate(scrapers):
+                if index not in split:
+                    # The normal scrape_headlines() path, error handling included
+                    whole[index] = fetchers.submit(self.aggregator._fetch_source, scraper)
+                    continue
+                self.aggregator.logger.info("Fetching headlines from %s...", scraper.name,
+                                            extra={'source': scraper.name})
+                fetchers.submit(self._fetch, index, scraper, pages)
+
+            for _ in split:
+                # Keep at most parse_workers * 2 pages in the process pool
+                while len(in_flight) >= self.max_pending:
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    collect(done)
+
+                index, content, timer, error = pages.get()
+                scraper = scrapers[index]
+                if error is not None:
+                    sources[index] = scraper.build_metadata([], timer, error)
+                    continue
+                if getattr(scraper, 'source_key', None) is None:
+                    # Not built from the registry, so a worker can't rebuild it
+                    sources[index] = self._parse_inline(scraper, content, timer)
+                    continue
+                future = pool.submit(parse_in_worker, scraper.source_key, scraper.parser, content)
+                in_flight[future] = (index, timer)
+
+        collect(list(in_flight))
+        for index, future in whole.items():
+            sources[index] = future.result()
+        return sources
@@ -1,8 +1,152 @@
 from abc import ABC, abstractmethod
+import codecs
+import re
 import requests
-from bs4 import BeautifulSoup
 import time
-from typing import List, Dict
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from typing import Callable, List, Dict, Optional
+
+from scrapers.parsers import parse_html
+from scrapers.streaming import StreamSelector, StreamingExtractor
+from utils.http_client import build_session
+from utils.metrics import PhaseTimer, current_timer, wire_bytes
+from utils.resilience import CircuitBreaker, CircuitOpenError, LatencyTracker, RetryPolicy
+
+def _close_response(future):
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+class CascadeState:
+    """Per-page bookkeeping for a SelectorCascade run
+    
+    Matches are offered per selector in document order. Selector i wins once
+    every higher-priority selector is exhausted without a headline and i has
+    at least one, which is what the old "try selectors one after another"
+    loops returned.
+    """
+    
+    def __init__(self, cascade: 'SelectorCascade', extract: Callable[[object], Optional[Dict]]):
+        self.cascade = cascade
+        self.extract = extract
+        self.scanned = [0] * len(cascade.selectors)
+        self.accepted = [[] for _ in cascade.selectors]
+        self.done = False
+    
+    def _exhausted(self, index: int) -> bool:
+        return (self.scanned[index] >= self.cascade.scan_limit
+                or len(self.accepted[index]) >= self.cascade.limit)
+    
+    def wants(self, index: int) -> bool:
+        """Whether a match for selector index could still affect the result"""
+        if self.done or self._exhausted(index):
+            return False
+        # A higher-priority selector already has headlines, so this one can't win
+        return not any(self.accepted[i] for i in range(index))
+    
+    def offer(self, index: int, element) -> bool:
+        """Record a match for selector index, returns True once the result is final"""
+        if not self.wants(index):
+            return self.done
+        
+        self.scanned[index] += 1
+        headline = self.extract(element)
+        if headline:
+            self.accepted[index].append(headline)
+        
+        for i in range(len(self.accepted)):
+            if not self._exhausted(i):
+                break
+            if self.accepted[i]:
+                self.done = True
+                break
+        return self.done
+    
+    def result(self) -> List[Dict]:
+        for headlines in self.accepted:
+            if headlines:
+                return headlines[:self.cascade.limit]
+        return []
+
+class SelectorCascade:
+    """Prioritized fallback selectors evaluated in a single tree walk
+    
+    Each selector considers at most scan_limit matching elements and the
+    first selector (by priority) yielding any headline wins, capped at limit.
+    The walk stops as soon as the winner can no longer change.
+    """
+    
+    def __init__(self, selectors: List[str], limit: int = 10, scan_limit: Optional[int] = None):
+        self.selectors = list(selectors)
+        self.limit = limit
+        self.scan_limit = scan_limit or limit
+        # Compiled on first use so importing a scraper stays cheap
+        self._compiled = None
+        self._stream_selectors = None
+    
+    @staticmethod
+    def _subject_tag(selector: str) -> Optional[str]:
+        last_compound = re.split(r'[\s>+~]+', selector.strip())[-1]
+        match = re.match(r'^([a-zA-Z][\w-]*)', last_compound)
+        return match.group(1).lower() if match else None
+    
+    def _compile(self) -> List:
+        """soupsieve matchers paired with the tag name of each selector's subject"""
+        if self._compiled is None:
+            import soupsieve
+            # The tag name lets most elements be skipped before running the full matcher
+            self._compiled = [
+                (soupsieve.compile(selector), self._subject_tag(selector))
+                for selector in self.selectors
+            ]
+        return self._compiled
+    
+    def stream_selectors(self) -> List[StreamSelector]:
+        """Selectors compiled for the streaming tokenizer (ValueError if unsupported)"""
+        if self._stream_selectors is None:
+            self._stream_selectors = [StreamSelector(selector) for selector in self.selectors]
+        return self._stream_selectors
+    
+    def supports_streaming(self) -> bool:
+        try:
+            self.stream_selectors()
+            return True
+        except ValueError:
+            return False
+    
+    def start(self, extract: Callable[[object], Optional[Dict]]) -> CascadeState:
+        return CascadeState(self, extract)
+    
+    def extract(self, document, extract: Callable[[object], Optional[Dict]]) -> List[Dict]:
+        """Run extract over matching elements and return the winning headlines"""
+        from bs4 import Tag
+        state = self.start(extract)
+        
+        if isinstance(document, Tag):
+            candidates = list(enumerate(self._compile()))
+            for element in document.descendants:
+                if not isinstance(element, Tag):
+                    continue
+                for index, (compiled, tag_name) in candidates:
+                    if tag_name and element.name != tag_name:
+                        continue
+                    if state.wants(index) and compiled.match(element):
+                        state.offer(index, element)
+                if state.done:
+                    break
+        else:
+            # Backends without a BeautifulSoup tree (selectolax) have fast
+            # native selectors, so query them selector by selector
+            for index, selector in enumerate(self.selectors):
+                if not state.wants(index):
+                    continue
+                for element in document.select(selector):
+                    state.offer(index, element)
+                    if not state.wants(index):
+                        break
+                if state.done:
+                    break
+        
+        return state.result()
 
 class BaseScraper(ABC):
     """Base class for news scrapers"""
@@ -10,42 +154,280 @@ class BaseScraper(ABC):
     def __init__(self, name: str, base_url: str):
         self.name = name
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        # HTTP session, created on first request unless one is injected
+        self._session = None
+        # Parser backend: 'auto', 'html.parser', 'lxml' or 'selectolax'
+        self.parser = 'auto'
+        # Optional ResponseCache, attached by NewsAggregator
+        self.cache = None
+        # Parsed pages keyed by URL, reused while the server answers 304
+        self._parsed_pages = {}
+        # Extract headlines while downloading and stop once the quota is met
+        self.streaming = False
+        self.stream_chunk_size = 16 * 1024
+        # Resilience: retries with jittered backoff, a per-source circuit
+        # breaker and, if hedge_percentile is set (e.g. 0.95), a second
+        # request when the first is slower than that latency percentile
+        self.retry_policy = RetryPolicy()
+        self.circuit_breaker = CircuitBreaker()
+        self.hedge_percentile = None
+        self.latency = LatencyTracker()
+        self._hedge_pool = None
+    
+    @property
+    def session(self) -> requests.Session:
+        # NewsAggregator injects one shared session; standalone scrapers get their own
+        if self._session is None:
+            self._session = build_session()
+        return self._session
+    
+    @session.setter
+    def session(self, session):
+        self._session = session
     
-    def fetch_page(self, url: str, timeout: int = 10) -> BeautifulSoup:
-        """Fetch and parse a web page"""
+    def fetch_page(self, url: str, timeout: int = 10):
+        """Fetch and parse a web page into a BeautifulSoup-compatible document"""
+        try:
+            content, not_modified = self._fetch_body(url, timeout)
+        except requests.RequestException as e:
+            raise Exception(f"Failed to fetch {url}: {str(e)}")
+        
+        # Reuse the parsed page while the server keeps answering 304
+        validator = self.cache.validator(url) if self.cache else None
+        parsed = self._parsed_pages.get(url)
+        if not_modified and parsed and parsed[0] == validator:
+            return parsed[1]
+        
+        soup = self.parse(content)
+        if validator:
+            self._parsed_pages[url] = (validator, soup)
+        return soup
+    
+    def fetch_raw(self, url: str, timeout: int = 10) -> bytes:
+        """Fetch a page's raw body (through the cache) without parsing it"""
+        try:
+            return self._fetch_body(url, timeout)[0]
+        except requests.RequestException as e:
+            raise Exception(f"Failed to fetch {url}: {str(e)}")
+    
+    def _fetch_body(self, url: str, timeout: int):
+        """Download a page body via the cache, returns (content, not_modified)"""
+        headers = self.cache.conditional_headers(url) if self.cache else {}
+        response = self._get(url, timeout, headers)
+        
+        if response.status_code == 304 and self.cache:
+            response.close()
+            content = self.cache.load(url)
+            if content is not None:
+                return content, True
+            # Cached body vanished (evicted), fall back to a full download
+            response = self._get(url, timeout)
+        
         try:
-            response = self.session.get(url, timeout=timeout)
             response.raise_for_status()
-            return BeautifulSoup(response.content, 'html.parser')
+        except requests.HTTPError:
+            # Give the connection back to the pool instead of leaving it to GC
+            response.close()
+            raise
+        content = self._download(response)
+        if self.cache:
+            self.cache.store(url, content, response.headers)
+        return content, False
+    
+    def _get(self, url: str, timeout: int, headers: Optional[Dict[str, str]] = None):
+        """Send a GET and return once the response headers have arrived
+        
+        Connection errors, timeouts and retryable statuses are retried per
+        retry_policy until its attempts or deadline run out; the final outcome
+        feeds the circuit breaker. Any other exception (too many redirects, an
+        invalid URL, ...) fails the fetch at once and also counts as a failure,
+        so a half-open trial never stays in flight.
+        """
+        if not self.circuit_breaker.allow():
+            raise CircuitOpenError(f"{self.name} skipped: circuit open after repeated failures")
+        
+        timer = current_timer()
+        policy = self.retry_policy
+        deadline = time.monotonic() + policy.deadline
+        attempt = 0
+        recorded = False
+        try:
+            while True:
+                attempt += 1
+                connect_before = timer.durations.get('connect', 0.0)
+                start = time.perf_counter()
+                attempt_timeout = max(0.1, min(timeout, deadline - time.monotonic()))
+                try:
+                    response = self._send(url, attempt_timeout, headers or {})
+                    failure = None if response.status_code not in policy.retry_statuses else response
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    failure = e
+                
+                elapsed = time.perf_counter() - start
+                if failure is None:
+                    # Time to first byte excludes any new-connection setup recorded meanwhile
+                    connect = timer.durations.get('connect', 0.0) - connect_before
+                    timer.add('ttfb', elapsed - connect)
+                    self.latency.add(elapsed)
+                    self.circuit_breaker.record_success()
+                    recorded = True
+                    return response
+                
+                delay = policy.delay(attempt)
+                if attempt >= policy.attempts or time.monotonic() + delay >= deadline:
+                    self.circuit_breaker.record_failure()
+                    recorded = True
+                    if isinstance(failure, requests.Response):
+                        return failure  # raise_for_status reports the final status
+                    raise failure
+                
+                if isinstance(failure, requests.Response):
+                    failure.close()
+                time.sleep(delay)
+        finally:
+            if not recorded:
+                # Non-retryable errors: the breaker must still hear about the
+                # failure, or a half-open trial would block every later call
+                self.circuit_breaker.record_failure()
+    
+    def _send(self, url: str, timeout: float, headers: Dict[str, str]):
+        """Single GET, hedged with a duplicate request when it runs unusually long"""
+        hedge_after = self.latency.percentile(self.hedge_percentile) if self.hedge_percentile else None
+        if hedge_after is None:
+            return self.session.get(url, timeout=timeout, headers=headers, stream=True)
+        
+        if self._hedge_pool is None:
+            self._hedge_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='news-hedge')
+        timer = current_timer()
+        
+        def request():
+            # Report connect time to the caller's timer from the worker thread
+            with timer.activate():
+                return self.session.get(url, timeout=timeout, headers=headers, stream=True)
+        
+        futures = [self._hedge_pool.submit(request)]
+        done, _ = wait(futures, timeout=hedge_after)
+        if not done:
+            futures.append(self._hedge_pool.submit(request))
+        
+        error = None
+        for future in as_completed(futures):
+            try:
+                response = future.result()
+            except requests.RequestException as e:
+                error = e
+                continue
+            # Release the connection of whichever request lost the race
+            for other in futures:
+                if other is not future:
+                    other.add_done_callback(_close_response)
+            return response
+        raise error
+    
+    def _download(self, response) -> bytes:
+        """Read the full response body"""
+        timer = current_timer()
+        with timer.phase('download'):
+            content = response.content
+        timer.bytes_received += wire_bytes(response, len(content))
+        return content
+    
+    def select_headlines(self, url: str, timeout: int = 10) -> List[Dict[str, str]]:
+        """Fetch a page and run the scraper's cascade over it
+        
+        In streaming mode the page is tokenized as it downloads; otherwise the
+        full document is fetched (through the cache) and parsed first.
+        """
+        if self.streaming and self.cascade.supports_streaming():
+            return self.stream_headlines(url, timeout)
+        soup = self.fetch_page(url, timeout)
+        with current_timer().phase('select'):
+            return self.cascade.extract(soup, self.extract_headline)
+    
+    def parse_headlines(self, content: bytes) -> List[Dict[str, str]]:
+        """Parse a downloaded page and run the scraper's cascade over it"""
+        soup = self.parse(content)
+        with current_timer().phase('select'):
+            return self.cascade.extract(soup, self.extract_headline)
+    
+    def stream_headlines(self, url: str, timeout: int = 10) -> List[Dict[str, str]]:
+        """Extract headlines incrementally, aborting the download once done"""
+        timer = current_timer()
+        try:
+            with self._get(url, timeout) as response:
+                response.raise_for_status()
+                extractor = StreamingExtractor(self.cascade, self.extract_headline,
+                                               self._declared_encoding(response))
+                # Tokenizing and selecting happen while feeding, so they are
+                # reported together as 'parse'; the rest is download time
+                start = time.perf_counter()
+                parse_time = 0.0
+                for chunk in response.iter_content(self.stream_chunk_size):
+                    feed_start = time.perf_counter()
+                    done = extractor.feed_bytes(chunk)
+                    parse_time += time.perf_counter() - feed_start
+                    if done:
+                        # Closing the response drops the rest of the body
+                        break
+                timer.add('download', time.perf_counter() - start - parse_time)
+                timer.add('parse', parse_time)
+                with timer.phase('parse'):
+                    headlines = extractor.finish()
+                timer.bytes_received += wire_bytes(response, 0)
+                return headlines
         except requests.RequestException as e:
             raise Exception(f"Failed to fetch {url}: {str(e)}")
     
+    @staticmethod
+    def _declared_encoding(response) -> str:
+        """Charset from the Content-Type header, defaulting to UTF-8"""
+        content_type = response.headers.get('Content-Type', '')
+        match = re.search(r'charset=["\']?([\w-]+)', content_type, re.IGNORECASE)
+        if match:
+            try:
+                return codecs.lookup(match.group(1)).name
+            except LookupError:
+                pass
+        return 'utf-8'
+    
+    def parse(self, content: bytes):
+        """Parse raw HTML with the configured parser backend"""
+        with current_timer().phase('parse'):
+            return parse_html(content, self.parser)
+    
     @abstractmethod
     def scrape_headlines(self) -> List[Dict[str, str]]:
         """Abstract method to scrape headlines"""
         pass
     
     def get_headlines_with_metadata(self) -> Dict:
-        """Get headlines with metadata"""
+        """Get headlines with metadata, including per-phase timings"""
+        timer = PhaseTimer()
         try:
-            headlines = self.scrape_headlines()
-            return {
-                'source': self.name,
-                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
-                'count': len(headlines),
-                'headlines': headlines,
-                'status': 'success'
-            }
+            with timer.activate(), timer.phase('total'):
+                headlines = self.scrape_headlines()
+            return self.build_metadata(headlines, timer)
         except Exception as e:
+            return self.build_metadata([], timer, e)
+    
+    def build_metadata(self, headlines: List[Dict[str, str]], timer: PhaseTimer,
+                       error: Optional[Exception] = None) -> Dict:
+        """Source metadata in the shape written to headlines.json"""
+        if error is not None:
             return {
                 'source': self.name,
                 'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
                 'count': 0,
                 'headlines': [],
                 'status': 'error',
-                'error': str(e)
-            }
\ No newline at end of file
+                'error': str(error),
+                'timings': timer.as_dict()
+            }
+        return {
+            'source': self.name,
+            'timestamp': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'count': len(headlines),
+            'headlines': headlines,
+            'status': 'success',
+            'timings': timer.as_dict()
+        }
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""HTML parser backends used by the news scrapers
+
+Every backend returns a document exposing the small subset of the
+BeautifulSoup API the scrapers rely on: ``select(css)`` on documents and
+elements, plus ``name``, ``get_text(strip=...)``, ``get(attr, default)`` and
+``find_parent(name)`` on elements.
+"""
+
+from importlib.util import find_spec
+from typing import List, Optional
+
+# Backends are only imported when first used to keep startup fast
+HAS_LXML = find_spec('lxml') is not None
+HAS_SELECTOLAX = find_spec('selectolax') is not None
+
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+class SelectolaxElement:
+    """BeautifulSoup-like wrapper around a selectolax node"""
+
+    __slots__ = ('node',)
+
+    def __init__(self, node):
+        self.node = node
+
+    @property
+    def name(self) -> str:
+        return self.node.tag
+
+    def get_text(self, strip: bool = False) -> str:
+        return self.node.text(deep=True, separator='', strip=strip)
+
+    def get(self, attr: str, default=None):
+        value = self.node.attributes.get(attr)
+        return default if value is None else value
+
+    def find_parent(self, name: Optional[str] = None) -> Optional['SelectolaxElement']:
+        parent = self.node.parent
+        while parent is not None:
+            if name is None or parent.tag == name:
+                return SelectolaxElement(parent)
+            parent = parent.parent
+        return None
+
+    def select(self, selector: str) -> List['SelectolaxElement']:
+        return [SelectolaxElement(node) for node in self.node.css(selector)]
+
+class SelectolaxDocument:
+    """BeautifulSoup-like wrapper around a lexbor parse tree"""
+
+    def __init__(self, content: bytes):
+        from selectolax.lexbor import LexborHTMLParser
+        self.tree = LexborHTMLParser(content)
+
+    def select(self, selector: str) -> List[SelectolaxElement]:
+        return [SelectolaxElement(node) for node in self.tree.css(selector)]
+
+def available_backends() -> List[str]:
+    """Backends that can be used with the installed packages"""
+    backends = ['html.parser']
+    if HAS_LXML:
+        backends.append('lxml')
+    if HAS_SELECTOLAX:
+        backends.append('selectolax')
+    return backends
+
+def resolve_backend(backend: str = 'auto') -> str:
+    """Map 'auto' to the fastest BeautifulSoup-compatible backend installed"""
+    if backend == 'auto':
+        return 'lxml' if HAS_LXML else 'html.parser'
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    if backend not in available_backends():
+        raise ValueError(f"Parser backend '{backend}' is not installed")
+    return backend
+
+def parse_html(content: bytes, backend: str = 'auto'):
+    """Parse raw HTML with the requested backend"""
+    backend = resolve_backend(backend)
+    if backend == 'selectolax':
+        return SelectolaxDocument(content)
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(content, backend)
@@ -0,0 +1,58 @@
+import importlib
+from typing import Dict, List
+
+# Built-in sources: short name -> "module:ClassName", imported only when used
+BUILTIN_SCRAPERS = {
+    'bbc': 'scrapers.bbc_scraper:BBCScraper',
+    'toi': 'scrapers.times_of_india_scraper:TimesOfIndiaScraper',
+    'aljazeera': 'scrapers.aljazeera_scraper:AlJazeeraScraper'
+}
+
+DEFAULT_SOURCES = ['bbc', 'toi', 'aljazeera']
+
+# Installed packages can register more scrapers under this entry point group:
+#   [project.entry-points."news_headlines.scrapers"]
+#   reuters = "my_package.reuters:ReutersScraper"
+ENTRY_POINT_GROUP = 'news_headlines.scrapers'
+
+def _entry_points() -> Dict[str, str]:
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # Python < 3.8
+        return {}
+
+    try:
+        points = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:  # Python < 3.10
+        points = entry_points().get(ENTRY_POINT_GROUP, [])
+    return {point.name: point.value for point in points}
+
+def available_scrapers() -> Dict[str, str]:
+    """Registered sources by name, without importing any scraper module"""
+    scrapers = dict(BUILTIN_SCRAPERS)
+    scrapers.update(_entry_points())
+    return scrapers
+
+def load_scraper_class(name: str):
+    """Import and return the scraper class registered under name"""
+    # Built-in names resolve without scanning installed package metadata
+    target = BUILTIN_SCRAPERS.get(name)
+    if target is None:
+        scrapers = available_scrapers()
+        if name not in scrapers:
+            raise ValueError(f"Unknown news source '{name}' (available: {', '.join(sorted(scrapers))})")
+        target = scrapers[name]
+
+    module_name, _, class_name = target.partition(':')
+    module = importlib.import_module(module_name)
+    return getattr(module, class_name)
+
+def create_scrapers(names: List[str]) -> List:
+    """Instantiate the scrapers for the given source names, in order"""
+    scrapers = []
+    for name in names:
+        scraper = load_scraper_class(name)()
+        # Lets other processes rebuild the same scraper by name
+        scraper.source_key = name
+        scrapers.append(scraper)
+    return scrapers
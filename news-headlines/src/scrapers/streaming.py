@@ -0,0 +1,252 @@
+"""Incremental headline extraction for BaseScraper's streaming mode
+
+The response body is fed chunk by chunk into an ``html.parser`` tokenizer
+that tracks the stack of open elements. Elements matching a scraper's
+SelectorCascade take their place in document order when they open and are
+handed to the cascade once they (and every earlier match of the same
+selector) have closed. The caller stops downloading once the cascade result
+is final.
+
+Only the selector subset used by the news scrapers is supported: compound
+selectors (tag, ``.class``, ``#id``, ``[attr]``, ``[attr="value"]``) joined by
+descendant or child combinators.
+"""
+
+import codecs
+import re
+from collections import deque
+from html.parser import HTMLParser
+from typing import Deque, Dict, List, Optional, Tuple
+
+# Elements that never have content or a closing tag
+VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+])
+
+# Elements implicitly closed by an opening tag of the same name
+SELF_CLOSING_SIBLINGS = frozenset(['p', 'li', 'option', 'tr', 'td', 'th', 'dt', 'dd'])
+
+_COMPOUND_RE = re.compile(
+    r'([a-zA-Z][\w-]*|\*)'
+    r'|\.([\w-]+)'
+    r'|#([\w-]+)'
+    r'|\[\s*([\w-]+)\s*(?:=\s*(?:"([^"]*)"|\'([^\']*)\'|([\w-]+))\s*)?\]'
+)
+
+class StreamElement:
+    """Open element seen by the tokenizer, with a BeautifulSoup-like API"""
+
+    __slots__ = ('name', 'attrs', 'parent', 'texts', 'matches', 'closed')
+
+    def __init__(self, name: str, attrs: Dict[str, str], parent: Optional['StreamElement']):
+        self.name = name
+        self.attrs = attrs
+        self.parent = parent
+        self.texts = []
+        self.matches = []
+        self.closed = False
+
+    def get_text(self, strip: bool = False) -> str:
+        if strip:
+            return ''.join(text.strip() for text in self.texts if text.strip())
+        return ''.join(self.texts)
+
+    def get(self, attr: str, default=None):
+        return self.attrs.get(attr, default)
+
+    def find_parent(self, name: Optional[str] = None) -> Optional['StreamElement']:
+        parent = self.parent
+        while parent is not None:
+            if name is None or parent.name == name:
+                return parent
+            parent = parent.parent
+        return None
+
+class StreamSelector:
+    """CSS selector matched against an element and its open ancestors"""
+
+    def __init__(self, selector: str):
+        self.selector = selector
+        # (compound, combinator linking it to the compound on its left), left to right
+        self.parts: List[Tuple[Dict, str]] = []
+
+        tokens = re.split(r'\s*(>)\s*|\s+', selector.strip())
+        combinator = ' '
+        for token in tokens:
+            if token is None or token == '':
+                continue
+            if token == '>':
+                combinator = '>'
+                continue
+            self.parts.append((self._parse_compound(token), combinator))
+            combinator = ' '
+        if not self.parts:
+            raise ValueError(f"Empty selector: {selector!r}")
+
+    def _parse_compound(self, text: str) -> Dict:
+        compound = {'tag': None, 'classes': [], 'attrs': []}
+        position = 0
+        while position < len(text):
+            match = _COMPOUND_RE.match(text, position)
+            if not match:
+                raise ValueError(f"Unsupported selector for streaming: {self.selector!r}")
+            tag, class_name, element_id, attr, *values = match.groups()
+            if tag:
+                compound['tag'] = None if tag == '*' else tag.lower()
+            elif class_name:
+                compound['classes'].append(class_name)
+            elif element_id:
+                compound['attrs'].append(('id', element_id))
+            else:
+                value = next((v for v in values if v is not None), None)
+                compound['attrs'].append((attr.lower(), value))
+            position = match.end()
+        return compound
+
+    @staticmethod
+    def _matches_compound(compound: Dict, element: StreamElement) -> bool:
+        if compound['tag'] and element.name != compound['tag']:
+            return False
+        if compound['classes']:
+            classes = element.attrs.get('class', '').split()
+            if any(name not in classes for name in compound['classes']):
+                return False
+        for attr, value in compound['attrs']:
+            if attr not in element.attrs:
+                return False
+            if value is not None and element.attrs[attr] != value:
+                return False
+        return True
+
+    def matches(self, element: StreamElement) -> bool:
+        return self._match_from(len(self.parts) - 1, element)
+
+    def _match_from(self, index: int, element: StreamElement) -> bool:
+        compound, _ = self.parts[index]
+        if not self._matches_compound(compound, element):
+            return False
+        if index == 0:
+            return True
+
+        # Combinator between parts[index - 1] and parts[index]
+        combinator = self.parts[index][1]
+        ancestor = element.parent
+        if combinator == '>':
+            return ancestor is not None and self._match_from(index - 1, ancestor)
+        while ancestor is not None:
+            if self._match_from(index - 1, ancestor):
+                return True
+            ancestor = ancestor.parent
+        return False
+
+class StreamingExtractor(HTMLParser):
+    """Feeds HTML chunks through a tokenizer and into a CascadeState"""
+
+    def __init__(self, cascade, extract, encoding: str = 'utf-8'):
+        super().__init__(convert_charrefs=True)
+        self.selectors = cascade.stream_selectors()
+        self.state = cascade.start(extract)
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self._stack: List[StreamElement] = []
+        self._capturing: List[StreamElement] = []
+        # Per selector, matches in document (start tag) order. A nested match
+        # closes before its ancestor, so it waits here until the earlier
+        # matches have closed and been offered.
+        self._pending: List[Deque[StreamElement]] = [deque() for _ in self.selectors]
+        # Text arrives in arbitrary pieces across chunks; it is buffered and
+        # attached as one string when the next tag starts or ends
+        self._pending_text: List[str] = []
+
+    @property
+    def done(self) -> bool:
+        return self.state.done
+
+    def feed_bytes(self, chunk: bytes) -> bool:
+        """Feed a raw chunk, returns True once no more input is needed"""
+        self.feed(self._decoder.decode(chunk))
+        return self.state.done
+
+    def finish(self) -> List[Dict]:
+        """Flush buffered input and return the cascade result"""
+        if not self.state.done:
+            self.feed(self._decoder.decode(b'', final=True))
+            self.close()
+            self._flush_text()
+            while self._stack and not self.state.done:
+                self._pop()
+        return self.state.result()
+
+    def _flush_text(self):
+        if not self._pending_text:
+            return
+        text = ''.join(self._pending_text)
+        self._pending_text = []
+        for element in self._capturing:
+            element.texts.append(text)
+
+    def _wants(self, index: int) -> bool:
+        # Matches already waiting count against the selector's scan limit
+        return (self.state.wants(index)
+                and self.state.scanned[index] + len(self._pending[index]) < self.state.cascade.scan_limit)
+
+    def _close(self, element: StreamElement):
+        """Offer the matches of each of the element's selectors that are now complete, in document order"""
+        element.closed = True
+        for index in element.matches:
+            pending = self._pending[index]
+            while pending and pending[0].closed:
+                if self.state.offer(index, pending.popleft()):
+                    return
+
+    def _pop(self):
+        element = self._stack.pop()
+        if element.matches:
+            self._capturing.remove(element)
+            self._close(element)
+
+    def handle_starttag(self, tag, attrs):
+        if self.state.done:
+            return
+        self._flush_text()
+        if self._stack and tag in SELF_CLOSING_SIBLINGS and self._stack[-1].name == tag:
+            self._pop()
+
+        parent = self._stack[-1] if self._stack else None
+        element = StreamElement(tag, {name: value or '' for name, value in attrs}, parent)
+        element.matches = [
+            index for index, selector in enumerate(self.selectors)
+            if self._wants(index) and selector.matches(element)
+        ]
+        for index in element.matches:
+            self._pending[index].append(element)
+
+        if tag in VOID_ELEMENTS:
+            if element.matches:
+                self._close(element)
+            return
+
+        self._stack.append(element)
+        if element.matches:
+            self._capturing.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and self._stack and self._stack[-1].name == tag:
+            self._pop()
+
+    def handle_endtag(self, tag):
+        if self.state.done:
+            return
+        self._flush_text()
+        # Close any unclosed elements nested inside the one being closed
+        if any(element.name == tag for element in self._stack):
+            while self._stack and not self.state.done:
+                if self._stack[-1].name == tag:
+                    self._pop()
+                    break
+                self._pop()
+
+    def handle_data(self, data):
+        if self._capturing:
+            self._pending_text.append(data)
@@ -0,0 +1,31 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict
+from urllib.parse import urlparse
+
+class HostLimiter:
+    """Caps the number of in-flight requests per host"""
+
+    def __init__(self, per_host: int = 2):
+        self.per_host = max(1, per_host)
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore_for(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host)
+                self._semaphores[host] = semaphore
+            return semaphore
+
+    @contextmanager
+    def limit(self, url: str):
+        """Block until a slot for the URL's host is free"""
+        semaphore = self._semaphore_for(url)
+        semaphore.acquire()
+        try:
+            yield
+        finally:
+            semaphore.release()
@@ -0,0 +1,169 @@
+import random
+import re
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+# Words too common in headlines to say anything about the story
+STOPWORDS = frozenset("""
+    a an and are as at be by for from has have in is it its of on or says the to was
+    were will with after over new
+""".split())
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+def title_tokens(title: str) -> FrozenSet[str]:
+    """Normalized word set of a headline (casefolded, no punctuation or stopwords)"""
+    words = re.findall(r'\w+', title.casefold())
+    tokens = frozenset(word for word in words if word not in STOPWORDS)
+    # A headline made only of stopwords still needs something to compare
+    return tokens or frozenset(words)
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+class _DisjointSet:
+    """Union-find that keeps each set's members and sources on its root"""
+
+    def __init__(self, sources: List[Optional[str]]):
+        self.parent = list(range(len(sources)))
+        self.members = [[index] for index in range(len(sources))]
+        self.sources = [frozenset([source]) if source else frozenset() for source in sources]
+
+    def find(self, item: int) -> int:
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, a: int, b: int):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            root, child = min(root_a, root_b), max(root_a, root_b)
+            self.parent[child] = root
+            self.members[root] += self.members[child]
+            self.sources[root] |= self.sources[child]
+            self.members[child] = []
+            self.sources[child] = frozenset()
+
+class HeadlineClusterer:
+    """Groups near-duplicate headlines with MinHash and locality-sensitive hashing
+
+    Each title becomes a MinHash signature of its word set. Signatures are
+    cut into bands; titles sharing any band land in the same bucket and
+    become candidate pairs, so only likely matches are compared instead of
+    every pair. Candidates are confirmed with the exact Jaccard similarity
+    and merged with union-find, most similar pairs first. With the defaults
+    (16 bands of 4 rows) pairs around threshold=0.5 are found with high
+    probability.
+
+    A cluster is one story as reported by different sources, so two groups
+    are only merged when no source is in both and every headline of one is
+    similar to every headline of the other. Otherwise short titles chain
+    distinct stories together ("Israel strikes Gaza" ~ "Israel strikes
+    Lebanon" ~ "Russia strikes Lebanon").
+    """
+
+    def __init__(self, threshold: float = 0.5, num_perm: int = 64, bands: int = 16, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self._permutations = tuple(
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+            for _ in range(num_perm)
+        )
+        # Words repeat across headlines and polls, so their hashes are reused
+        self._token_hashes = lru_cache(maxsize=65536)(self._hash_token)
+        # and front pages barely change between polls, so whole signatures are too
+        self.signature = lru_cache(maxsize=8192)(self._signature)
+
+    def _hash_token(self, token: str) -> Tuple[int, ...]:
+        """The token's value under every permutation"""
+        h = zlib.crc32(token.encode('utf-8'))
+        return tuple((a * h + b) % _MERSENNE_PRIME for a, b in self._permutations)
+
+    def _signature(self, tokens: FrozenSet[str]) -> Tuple[int, ...]:
+        """MinHash signature: per permutation, the minimum over the tokens"""
+        if not tokens:
+            return self._token_hashes('')
+        return tuple(map(min, zip(*map(self._token_hashes, tokens))))
+
+    @staticmethod
+    def _other_source(first: Dict, second: Dict) -> bool:
+        source = first.get('source')
+        return not source or source != second.get('source')
+
+    def cluster(self, headlines: List[Dict]) -> List[List[int]]:
+        """Indexes of headlines grouped by story, largest groups first
+
+        Headlines carrying the same 'source' are never grouped together.
+        """
+        tokens = [title_tokens(headline['title']) for headline in headlines]
+        groups = _DisjointSet([headline.get('source') for headline in headlines])
+
+        buckets = defaultdict(list)
+        for index, title in enumerate(tokens):
+            signature = self.signature(title)
+            for band in range(self.bands):
+                start = band * self.rows
+                buckets[(band, signature[start:start + self.rows])].append(index)
+
+        candidates = {}
+        for members in buckets.values():
+            for position, first in enumerate(members):
+                for second in members[position + 1:]:
+                    pair = (first, second)
+                    if pair in candidates or not self._other_source(headlines[first], headlines[second]):
+                        continue
+                    candidates[pair] = jaccard(tokens[first], tokens[second])
+
+        matches = sorted((-similarity, pair) for pair, similarity in candidates.items()
+                         if similarity >= self.threshold)
+        for _, (first, second) in matches:
+            root_a, root_b = groups.find(first), groups.find(second)
+            if root_a == root_b or groups.sources[root_a] & groups.sources[root_b]:
+                continue
+            # Complete linkage: every pair across the two groups must match
+            if all(jaccard(tokens[a], tokens[b]) >= self.threshold
+                   for a in groups.members[root_a] for b in groups.members[root_b]):
+                groups.union(first, second)
+
+        clusters = defaultdict(list)
+        for index in range(len(headlines)):
+            clusters[groups.find(index)].append(index)
+        return sorted(clusters.values(), key=lambda members: (-len(members), members[0]))
+
+def cluster_sources(sources: List[Dict], clusterer: Optional[HeadlineClusterer] = None) -> List[Dict]:
+    """Near-duplicate clusters across the headlines of successful sources
+
+    Returns one entry per story reported more than once, with the first
+    headline's title as the representative.
+    """
+    clusterer = clusterer or HeadlineClusterer()
+    headlines = [
+        dict(headline, source=source_data['source'])
+        for source_data in sources if source_data['status'] == 'success'
+        for headline in source_data['headlines']
+    ]
+
+    clusters = []
+    for members in clusterer.cluster(headlines):
+        if len(members) < 2:
+            break
+        items = [headlines[index] for index in members]
+        clusters.append({
+            'title': items[0]['title'],
+            'size': len(items),
+            'sources': sorted({item['source'] for item in items}),
+            'headlines': [
+                {'source': item['source'], 'title': item['title'], 'url': item.get('url', '')}
+                for item in items
+            ]
+        })
+    return clusters
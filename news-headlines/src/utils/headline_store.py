@@ -0,0 +1,97 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+class HeadlineStore:
+    """Append-only SQLite store of deduplicated headlines
+
+    Each headline is keyed by a hash of its normalized title and URL, so
+    re-scraping an unchanged front page writes nothing. Rows get increasing
+    ids that double as cursors: readers remember the last id they saw and
+    ask for everything after it.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS headlines (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            key TEXT NOT NULL UNIQUE,
+            source TEXT NOT NULL,
+            title TEXT NOT NULL,
+            url TEXT NOT NULL,
+            first_seen TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_headlines_source ON headlines (source, id);
+    """
+
+    def __init__(self, path: str = 'output/headlines.db'):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL lets readers poll the store while a run is writing to it
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(self.SCHEMA)
+
+    @staticmethod
+    def headline_key(title: str, url: str) -> str:
+        """Content hash of a headline's normalized title and URL"""
+        normalized_title = re.sub(r'\s+', ' ', title).strip().casefold()
+        normalized_url = url.strip().split('#', 1)[0]
+        return hashlib.sha1(f"{normalized_title}\n{normalized_url}".encode('utf-8')).hexdigest()
+
+    def add_headlines(self, source: str, headlines: List[Dict[str, str]],
+                      seen_at: Optional[str] = None) -> List[Dict]:
+        """Insert headlines not seen before, returns the new rows"""
+        seen_at = seen_at or time.strftime('%Y-%m-%d %H:%M:%S')
+        added = []
+        with self._lock, self._conn:
+            for headline in headlines:
+                key = self.headline_key(headline['title'], headline.get('url', ''))
+                cursor = self._conn.execute(
+                    'INSERT OR IGNORE INTO headlines (key, source, title, url, first_seen) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (key, source, headline['title'], headline.get('url', ''), seen_at)
+                )
+                if cursor.rowcount:
+                    added.append({
+                        'id': cursor.lastrowid,
+                        'source': source,
+                        'title': headline['title'],
+                        'url': headline.get('url', ''),
+                        'first_seen': seen_at
+                    })
+        return added
+
+    def since(self, cursor: int = 0, limit: Optional[int] = None,
+              source: Optional[str] = None) -> List[Dict]:
+        """Headlines stored after the given cursor, oldest first"""
+        query = 'SELECT id, source, title, url, first_seen FROM headlines WHERE id > ?'
+        params = [cursor]
+        if source:
+            query += ' AND source = ?'
+            params.append(source)
+        query += ' ORDER BY id'
+        if limit:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def latest_cursor(self) -> int:
+        """Id of the most recently stored headline (0 when empty)"""
+        with self._lock:
+            row = self._conn.execute('SELECT MAX(id) FROM headlines').fetchone()
+        return row[0] or 0
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+class ResponseCache:
+    """On-disk HTTP response cache with ETag/Last-Modified revalidation
+
+    Bodies are stored one file per URL next to a small JSON index holding
+    the validators, size and last access time of each entry. When the total
+    size exceeds max_bytes the least recently used entries are evicted.
+    """
+
+    INDEX_FILE = 'index.json'
+
+    def __init__(self, directory: str = 'output/.cache', max_bytes: int = 50 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+        self._index = self._load_index()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.body")
+
+    def _load_index(self) -> Dict[str, Dict]:
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Drop entries whose body file has gone missing
+        return {key: entry for key, entry in index.items() if os.path.exists(self._body_path(key))}
+
+    def _save_index(self):
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, path)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Revalidation headers for a cached URL (empty if not cached)"""
+        with self._lock:
+            entry = self._index.get(self._key(url))
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def validator(self, url: str) -> Optional[str]:
+        """Opaque token identifying the cached version of a URL"""
+        with self._lock:
+            entry = self._index.get(self._key(url))
+        if not entry:
+            return None
+        return entry.get('etag') or entry.get('last_modified')
+
+    def load(self, url: str) -> Optional[bytes]:
+        """Return the cached body for a URL and mark it as recently used"""
+        key = self._key(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if not entry:
+                return None
+            try:
+                with open(self._body_path(key), 'rb') as f:
+                    body = f.read()
+            except OSError:
+                del self._index[key]
+                self._save_index()
+                return None
+            entry['accessed'] = time.time()
+            self._save_index()
+        return body
+
+    def store(self, url: str, body: bytes, headers) -> bool:
+        """Cache a response body if the server sent validators for it"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return False
+        if len(body) > self.max_bytes:
+            return False
+
+        key = self._key(url)
+        with self._lock:
+            tmp_path = f"{self._body_path(key)}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, self._body_path(key))
+
+            self._index[key] = {
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'size': len(body),
+                'accessed': time.time()
+            }
+            self._evict()
+            self._save_index()
+        return True
+
+    def _evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        total = sum(entry['size'] for entry in self._index.values())
+        if total <= self.max_bytes:
+            return
+
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]['accessed']):
+            try:
+                os.remove(self._body_path(key))
+            except OSError:
+                pass
+            del self._index[key]
+            total -= entry['size']
+            if total <= self.max_bytes:
+                break
@@ -0,0 +1,144 @@
+import io
+import os
+import ssl
+import threading
+from importlib.util import find_spec
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util import make_headers
+
+from utils.metrics import TimingAdapter
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+
+HAS_HTTP2 = find_spec('httpx') is not None and find_spec('h2') is not None
+
+def accept_encoding() -> str:
+    """Content codings urllib3 can decode here: gzip and deflate, plus br/zstd
+    when brotli or zstandard is installed"""
+    return make_headers(accept_encoding=True)['accept-encoding']
+
+class HTTP2Adapter(BaseAdapter):
+    """requests transport adapter that sends requests over httpx with HTTP/2
+
+    httpx negotiates h2 via ALPN and multiplexes requests to the same host
+    over one connection. Bodies are read in full before returning, so
+    streaming extraction gains nothing from it, and connection setup time is
+    not reported to the PhaseTimer.
+
+    requests' verify, cert and proxies settings (including REQUESTS_CA_BUNDLE
+    and HTTPS_PROXY, which the session merges in) are honored. httpx fixes
+    TLS and proxy settings per client, so one client is kept per distinct
+    combination.
+    """
+
+    def __init__(self, max_connections: int = 20, max_keepalive_connections: int = 10):
+        super().__init__()
+        import httpx
+        self._httpx = httpx
+        self._limits = httpx.Limits(max_connections=max_connections,
+                                    max_keepalive_connections=max_keepalive_connections)
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _ssl_context(verify, cert) -> ssl.SSLContext:
+        """requests' verify (bool or CA bundle path) and cert (path or (cert, key)) as an SSLContext"""
+        if verify is False:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif verify is True:
+            context = ssl.create_default_context(cafile=requests.certs.where())
+        elif isinstance(verify, str) and os.path.isdir(verify):
+            context = ssl.create_default_context(capath=verify)
+        elif isinstance(verify, str):
+            context = ssl.create_default_context(cafile=verify)
+        else:
+            raise ValueError(f"Unsupported verify setting for HTTP/2: {verify!r}")
+        if cert:
+            certfile, keyfile = cert if isinstance(cert, tuple) else (cert, None)
+            context.load_cert_chain(certfile, keyfile)
+        # Advertise h2 like httpx's own contexts do
+        context.set_alpn_protocols(['h2', 'http/1.1'])
+        return context
+
+    def _client(self, verify, cert, proxy):
+        key = (verify, cert, proxy)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._httpx.Client(http2=True, limits=self._limits,
+                                            verify=self._ssl_context(verify, cert), proxy=proxy)
+                self._clients[key] = client
+            return client
+
+    def _timeout(self, timeout):
+        """requests timeout (seconds, (connect, read) or None) as an httpx.Timeout"""
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self._httpx.Timeout(read, connect=connect)
+        return self._httpx.Timeout(timeout)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        httpx = self._httpx
+        if isinstance(cert, list):
+            cert = tuple(cert)
+        client = self._client(verify, cert, requests.utils.select_proxy(request.url, proxies or {}))
+        # HTTP/2 forbids connection-specific headers
+        headers = {name: value for name, value in request.headers.items() if name.lower() != 'connection'}
+        try:
+            reply = client.request(request.method, request.url, headers=headers,
+                                   content=request.body, timeout=self._timeout(timeout))
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e), request=request) from e
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(str(e), request=request) from e
+
+        # httpx has already decoded the body
+        body = reply.content
+        response = requests.Response()
+        response.status_code = reply.status_code
+        response.headers = CaseInsensitiveDict(reply.headers)
+        response.headers.pop('Content-Encoding', None)
+        response.headers['Content-Length'] = str(len(body))
+        response.raw = io.BytesIO(body)
+        response.url = str(reply.url)
+        response.request = request
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.reason = reply.reason_phrase
+        response.connection = self
+        return response
+
+    def close(self):
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+def build_session(pool_connections: int = 10, pool_maxsize: int = 10, http2: bool = False) -> requests.Session:
+    """A keep-alive session with sized connection pools and compression negotiation
+
+    pool_connections is the number of hosts whose pools are kept,
+    pool_maxsize the connections kept open per host. http2=True routes
+    requests through httpx (pip install 'httpx[http2]'); without it the
+    session stays on HTTP/1.1.
+    """
+    session = requests.Session()
+    if http2 and HAS_HTTP2:
+        adapter = HTTP2Adapter(max_connections=pool_connections * pool_maxsize,
+                               max_keepalive_connections=pool_connections * pool_maxsize)
+    else:
+        # Reports connection setup time to the active PhaseTimer
+        adapter = TimingAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': accept_encoding(),
+        'Connection': 'keep-alive'
+    })
+    return session
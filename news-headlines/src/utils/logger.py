@@ -1,25 +1,89 @@
-
+import atexit
+import json
 import logging
+import queue
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+# Attributes every LogRecord has; anything else came in through extra={...}
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+_listener = None
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any extra={...} fields"""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'message': record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves formatting to the listener thread
+
+    The stock handler renders the message before enqueueing; records here
+    never leave the process, so msg % args is only evaluated by the
+    listener. Log arguments must therefore not be mutated after the call.
+    """
 
-def setup_logger():
-    """Setup logger with console and file handlers"""
+    def prepare(self, record):
+        return record
+
+def setup_logger(queued: bool = False, json_format: bool = False, level: int = logging.INFO):
+    """Setup logger with console and file handlers
+
+    queued=True puts a QueueHandler on the logger and moves formatting and
+    writing to a background QueueListener thread, so logging from the
+    scraping path only enqueues the record. json_format=True writes
+    structured JSON lines instead of plain text. Only the first call
+    configures the logger.
+    """
+    global _listener
     logger = logging.getLogger('news_scraper')
-    logger.setLevel(logging.INFO)
-    
+    if logger.handlers:
+        return logger
+    logger.setLevel(level)
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.INFO)
-    
+    console_handler.setLevel(level)
+
     # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    if json_format:
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
     console_handler.setFormatter(formatter)
-    
+
     # Add handlers
-    if not logger.handlers:
+    if queued:
+        records = queue.SimpleQueue()
+        logger.addHandler(_DeferredQueueHandler(records))
+        _listener = QueueListener(records, console_handler, respect_handler_level=True)
+        _listener.start()
+        # Flush whatever is still queued when the process exits
+        atexit.register(stop_logging)
+    else:
         logger.addHandler(console_handler)
-    
-    return logger
\ No newline at end of file
+
+    return logger
+
+def stop_logging():
+    """Stop the background listener after writing out queued records"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
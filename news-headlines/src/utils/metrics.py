@@ -0,0 +1,144 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+PHASES = ('connect', 'ttfb', 'download', 'parse', 'select', 'total')
+
+_local = threading.local()
+
+class PhaseTimer:
+    """Per-phase durations and bytes received for one source scrape"""
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        self.bytes_received = 0
+
+    def add(self, phase: str, seconds: float):
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    @contextmanager
+    def activate(self):
+        """Make this timer the one recorded into by the current thread"""
+        previous = getattr(_local, 'timer', None)
+        _local.timer = self
+        try:
+            yield self
+        finally:
+            _local.timer = previous
+
+    def as_dict(self) -> Dict:
+        timings = {f"{phase}_ms": round(self.durations.get(phase, 0.0) * 1000, 2) for phase in PHASES}
+        timings['bytes_received'] = self.bytes_received
+        return timings
+
+class _NullTimer(PhaseTimer):
+    """Timer used when nothing is being measured; discards everything"""
+
+    def add(self, phase: str, seconds: float):
+        pass
+
+_NULL_TIMER = _NullTimer()
+
+def current_timer() -> PhaseTimer:
+    """Timer active on this thread, or a no-op timer"""
+    return getattr(_local, 'timer', None) or _NULL_TIMER
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            current_timer().add('connect', time.perf_counter() - start)
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        # Includes the TLS handshake
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            current_timer().add('connect', time.perf_counter() - start)
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+class TimingAdapter(HTTPAdapter):
+    """HTTPAdapter that reports new-connection setup time to the active PhaseTimer
+
+    Reused keep-alive connections record no connect time.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool
+        }
+
+def wire_bytes(response, fallback: Optional[int] = None) -> int:
+    """Bytes read off the socket for a response body (before decompression)"""
+    try:
+        return int(response.raw.tell())
+    except (AttributeError, TypeError, ValueError):
+        return fallback if fallback is not None else len(response.content)
+
+def _escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def to_prometheus(results: Dict) -> str:
+    """Render per-source timings from aggregated results in Prometheus text format"""
+    lines = [
+        '# HELP news_scrape_phase_seconds Time spent in each scrape phase.',
+        '# TYPE news_scrape_phase_seconds gauge'
+    ]
+    for source_data in results['sources']:
+        timings = source_data.get('timings', {})
+        label = _escape_label(source_data['source'])
+        for phase in PHASES:
+            seconds = timings.get(f"{phase}_ms", 0.0) / 1000
+            lines.append(f'news_scrape_phase_seconds{{source="{label}",phase="{phase}"}} {seconds:.6f}')
+
+    lines += [
+        '# HELP news_scrape_bytes_received Response body bytes received.',
+        '# TYPE news_scrape_bytes_received gauge'
+    ]
+    for source_data in results['sources']:
+        label = _escape_label(source_data['source'])
+        bytes_received = source_data.get('timings', {}).get('bytes_received', 0)
+        lines.append(f'news_scrape_bytes_received{{source="{label}"}} {bytes_received}')
+
+    lines += [
+        '# HELP news_scrape_headlines Headlines returned by the last scrape.',
+        '# TYPE news_scrape_headlines gauge'
+    ]
+    for source_data in results['sources']:
+        label = _escape_label(source_data['source'])
+        lines.append(f'news_scrape_headlines{{source="{label}"}} {source_data.get("count", 0)}')
+
+    lines += [
+        '# HELP news_scrape_success Whether the last scrape succeeded (1) or failed (0).',
+        '# TYPE news_scrape_success gauge'
+    ]
+    for source_data in results['sources']:
+        label = _escape_label(source_data['source'])
+        success = 1 if source_data['status'] == 'success' else 0
+        lines.append(f'news_scrape_success{{source="{label}"}} {success}')
+
+    return '\n'.join(lines) + '\n'
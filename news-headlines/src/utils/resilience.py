@@ -0,0 +1,93 @@
+import random
+import threading
+import time
+from collections import deque
+from typing import Optional, Tuple
+
+class CircuitOpenError(Exception):
+    """Raised instead of a request while a source's circuit breaker is open"""
+
+class RetryPolicy:
+    """Exponential backoff with full jitter, bounded by a per-fetch deadline"""
+
+    def __init__(self, attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0,
+                 deadline: float = 20.0,
+                 retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retry_statuses = retry_statuses
+
+    def delay(self, attempt: int) -> float:
+        """Sleep before retry number attempt (1-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+class CircuitBreaker:
+    """Skips a source for a cooldown after consecutive failed fetches
+
+    closed: requests flow normally. After failure_threshold consecutive
+    failures the breaker opens and every request is refused until cooldown
+    seconds have passed; then one trial request is let through (half-open).
+    Its success closes the breaker, its failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 300.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.cooldown:
+            return 'half-open'
+        return 'open'
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+class LatencyTracker:
+    """Sliding window of recent request latencies"""
+
+    def __init__(self, window: int = 50, min_samples: int = 5):
+        self.samples = deque(maxlen=window)
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def add(self, seconds: float):
+        with self._lock:
+            self.samples.append(seconds)
+
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Latency at the given fraction (e.g. 0.95), None until enough samples"""
+        with self._lock:
+            if len(self.samples) < self.min_samples:
+                return None
+            ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+        return ordered[index]
@@ -0,0 +1,73 @@
+import os
+import sys
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import NewsAggregator
+from utils.dedup import HeadlineClusterer, cluster_sources
+
+def headline(source, title):
+    return {'source': source, 'title': title}
+
+def source(name, *titles):
+    return {
+        'source': name,
+        'status': 'success',
+        'timestamp': '2025-10-01 12:00:00',
+        'headlines': [{'title': title, 'url': ''} for title in titles],
+        'count': len(titles)
+    }
+
+def test_same_story_from_two_sources_clusters_together():
+    headlines = [
+        headline('BBC News', "UK inflation falls to 3% in September"),
+        headline('Al Jazeera', "Inflation in UK falls to 3% in September"),
+    ]
+    assert HeadlineClusterer().cluster(headlines) == [[0, 1]]
+
+def test_same_source_near_duplicates_stay_separate():
+    headlines = [
+        headline('BBC News', "Israel strikes Gaza"),
+        headline('BBC News', "Israel strikes Lebanon"),
+        headline('BBC News', "Russia strikes Lebanon"),
+    ]
+    assert HeadlineClusterer().cluster(headlines) == [[0], [1], [2]]
+
+def test_chain_of_similar_stories_is_not_merged():
+    # A~B and B~C share 2 of 3 content words, A and C only one
+    headlines = [
+        headline('BBC News', "Israel strikes Gaza"),
+        headline('CNN', "Israel strikes Lebanon"),
+        headline('Reuters', "Russia strikes Lebanon"),
+    ]
+    clusters = HeadlineClusterer().cluster(headlines)
+    assert max(len(members) for members in clusters) == 2
+    assert [0, 2] not in clusters
+
+def test_different_stories_sharing_two_of_three_words_do_not_cluster():
+    headlines = [
+        headline('BBC News', "Parliament approves budget"),
+        headline('CNN', "Parliament rejects budget"),
+    ]
+    assert HeadlineClusterer(threshold=0.6).cluster(headlines) == [[0], [1]]
+
+def test_unique_headlines_counts_each_cluster_once():
+    sources = [
+        source('BBC News', "UK inflation falls to 3% in September", "Storm closes schools",
+               "Israel strikes Gaza"),
+        source('Al Jazeera', "Inflation in UK falls to 3% in September", "Israel strikes Lebanon"),
+        source('CNN', "UK inflation falls to 3% in September", "Russia strikes Lebanon"),
+    ]
+    clusters = cluster_sources(sources)
+    assert [cluster['size'] for cluster in clusters] == [3, 2]
+    assert clusters[0]['sources'] == ['Al Jazeera', 'BBC News', 'CNN']
+
+    aggregator = NewsAggregator(sources=[], cache_dir=None, store_path=None)
+    try:
+        results = aggregator.summarize(sources)
+    finally:
+        aggregator.close()
+    assert results['total_headlines'] == 7
+    # Inflation story, one strikes pair, the other strikes story, the storm
+    assert results['unique_headlines'] == 4
@@ -0,0 +1,60 @@
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+import requests
+
+pytest.importorskip('httpx')
+pytest.importorskip('h2')
+
+from utils.http_client import HTTP2Adapter, build_session
+
+class Handler(BaseHTTPRequestHandler):
+    paths = []
+
+    def do_GET(self):
+        self.paths.append(self.path)
+        if self.path.endswith('/slow'):
+            time.sleep(1)
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'ok')
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+
+@pytest.fixture
+def session():
+    session = build_session(http2=True)
+    assert isinstance(session.get_adapter('https://example.com'), HTTP2Adapter)
+    yield session
+    session.close()
+
+def test_requests_go_through_the_configured_proxy(server, session):
+    response = session.get('http://news.example.com/world', proxies={'http': server}, timeout=5)
+    assert response.status_code == 200
+    # A proxy gets the absolute URL
+    assert Handler.paths[-1] == 'http://news.example.com/world'
+
+def test_connect_read_timeout_tuple_applies_the_read_timeout(server, session):
+    with pytest.raises(requests.Timeout):
+        session.get(f'{server}/slow', timeout=(5, 0.2))
+
+def test_ca_bundle_setting_is_not_ignored(session):
+    # Loading the bundle fails before any connection is attempted
+    with pytest.raises(FileNotFoundError):
+        session.get('https://127.0.0.1:1/', verify='/nonexistent/ca-bundle.pem', timeout=1)
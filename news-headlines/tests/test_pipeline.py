@@ -0,0 +1,38 @@
+import os
+import sys
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from main import NewsAggregator
+from pipeline import FetchParsePipeline
+from scrapers.base_scraper import BaseScraper
+
+class FeedScraper(BaseScraper):
+    """A source that only implements scrape_headlines(), without a cascade"""
+
+    def __init__(self):
+        super().__init__("Feed", "https://feed.example.com")
+
+    def scrape_headlines(self):
+        return [{'title': "From the feed", 'url': self.base_url, 'source': self.name}]
+
+class BrokenScraper(FeedScraper):
+    def scrape_headlines(self):
+        raise RuntimeError("feed is down")
+
+def test_scrapers_without_a_cascade_take_the_scrape_headlines_path():
+    aggregator = NewsAggregator(sources=[], cache_dir=None, store_path=None)
+    pipeline = FetchParsePipeline(aggregator, parse_workers=1)
+    try:
+        feed, broken = FeedScraper(), BrokenScraper()
+        assert not pipeline.splittable(feed)
+
+        sources = pipeline.run([feed, broken])
+    finally:
+        pipeline.close()
+
+    assert sources[0]['status'] == 'success'
+    assert [headline['title'] for headline in sources[0]['headlines']] == ["From the feed"]
+    assert sources[1]['status'] == 'error'
+    assert sources[1]['headlines'] == []
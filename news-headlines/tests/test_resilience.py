@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import pytest
+import requests
+
+from scrapers.bbc_scraper import BBCScraper
+from utils.resilience import CircuitBreaker, CircuitOpenError
+
+COOLDOWN = 0.05
+
+def ok_response():
+    response = requests.Response()
+    response.status_code = 200
+    return response
+
+def scraper_with(send):
+    scraper = BBCScraper()
+    scraper.circuit_breaker = CircuitBreaker(failure_threshold=1, cooldown=COOLDOWN)
+    scraper._send = send
+    return scraper
+
+def redirect_loop(url, timeout, headers):
+    raise requests.TooManyRedirects("Exceeded 30 redirects.")
+
+def test_non_retryable_error_in_half_open_trial_reopens_the_breaker():
+    scraper = scraper_with(redirect_loop)
+    breaker = scraper.circuit_breaker
+
+    with pytest.raises(requests.TooManyRedirects):
+        scraper._get(scraper.base_url, timeout=1)
+    assert breaker.state == 'open'
+
+    time.sleep(COOLDOWN * 1.5)
+    assert breaker.state == 'half-open'
+    # The trial fails with an error that isn't retried
+    with pytest.raises(requests.TooManyRedirects):
+        scraper._get(scraper.base_url, timeout=1)
+    assert breaker.state == 'open'
+    with pytest.raises(CircuitOpenError):
+        scraper._get(scraper.base_url, timeout=1)
+
+    # After the next cooldown a new trial is let through and can close it
+    time.sleep(COOLDOWN * 1.5)
+    scraper._send = lambda url, timeout, headers: ok_response()
+    assert scraper._get(scraper.base_url, timeout=1).status_code == 200
+    assert breaker.state == 'closed'
+
+def test_unexpected_exception_releases_the_trial():
+    def broken(url, timeout, headers):
+        raise ValueError("bug in a transport adapter")
+
+    scraper = scraper_with(broken)
+    breaker = scraper.circuit_breaker
+    breaker.record_failure()
+    time.sleep(COOLDOWN * 1.5)
+
+    with pytest.raises(ValueError):
+        scraper._get(scraper.base_url, timeout=1)
+    time.sleep(COOLDOWN * 1.5)
+    assert breaker.allow()
+
+def test_error_response_is_closed_before_raising():
+    closed = []
+    response = requests.Response()
+    response.status_code = 503
+    response.url = 'https://www.bbc.com/news'
+    response.close = lambda: closed.append(True)
+
+    scraper = scraper_with(lambda url, timeout, headers: response)
+    scraper.retry_policy.attempts = 1
+    with pytest.raises(requests.HTTPError):
+        scraper._fetch_body(scraper.base_url, 1)
+    assert closed
@@ -0,0 +1,38 @@
+import os
+import sys
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bs4 import BeautifulSoup
+
+from scrapers.base_scraper import SelectorCascade
+from scrapers.bbc_scraper import BBCScraper
+from scrapers.streaming import StreamingExtractor
+
+NESTED = ('<h3 data-testid="card-headline">Outer headline text '
+          '<span><h3 data-testid="card-headline">Inner headline text</h3></span></h3>'
+          '<h3 data-testid="card-headline">Last headline text</h3>')
+
+def stream(scraper, html: str, cascade=None, chunk_size: int = 7):
+    extractor = StreamingExtractor(cascade or scraper.cascade, scraper.extract_headline)
+    data = html.encode('utf-8')
+    for start in range(0, len(data), chunk_size):
+        if extractor.feed_bytes(data[start:start + chunk_size]):
+            break
+    return extractor.finish()
+
+def test_nested_matches_come_out_in_document_order():
+    scraper = BBCScraper()
+    dom = scraper.cascade.extract(BeautifulSoup(NESTED, 'html.parser'), scraper.extract_headline)
+    streamed = stream(scraper, NESTED)
+    assert [headline['title'] for headline in streamed] == [
+        'Outer headline textInner headline text', 'Inner headline text', 'Last headline text'
+    ]
+    assert streamed == dom
+
+def test_scan_limit_keeps_the_first_matches_in_document_order():
+    scraper = BBCScraper()
+    cascade = SelectorCascade(scraper.cascade.selectors, limit=10, scan_limit=1)
+    streamed = stream(scraper, NESTED, cascade)
+    assert [headline['title'] for headline in streamed] == ['Outer headline textInner headline text']